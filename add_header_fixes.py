@@ -1,16 +1,18 @@
 #!/usr/bin/env python3
+from patch_utils import buffer_output, rewrite_file
 
-with open('public/index.html', 'r') as f:
-    content = f.read()
+buffer_output()
 
 # Add table headers fix in the head (high priority)
-if 'table-headers-fix.js' not in content:
-    content = content.replace(
+added = rewrite_file(
+    'public/index.html',
+    [(
         '<!-- *** CRITICAL JS - HIGH PRIORITY - Load immediately *** -->',
         '''<!-- *** CRITICAL JS - HIGH PRIORITY - Load immediately *** -->
     <script src="%PUBLIC_URL%/js/table-headers-fix.js"></script>'''
-    )
-    print("✅ Added table-headers-fix.js to head")
+    )],
+    skip_if='table-headers-fix.js'
+)
 
-with open('public/index.html', 'w') as f:
-    f.write(content)
+if added:
+    print("✅ Added table-headers-fix.js to head")
@@ -1,21 +1,31 @@
 #!/usr/bin/env python3
+from patch_utils import apply_fix, buffer_output, show_lines, split_lines
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    lines = f.readlines()
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
-# After line 984 (</div>), we need to add the closing )}
-# Line 984 is index 983
 
-print("Adding missing closing )}...")
+def transform(content):
+    lines = split_lines(content)
 
-# Insert the closing after line 984
-lines.insert(984, '        )}\n')
+    # After line 984 (</div>), we need to add the closing )}
+    # Line 984 is index 983
 
-print("\nLines 975-995 after fix:")
-for i in range(974, min(995, len(lines))):
-    print(f"Line {i+1}: {lines[i].rstrip()}")
+    print("Adding missing closing )}...")
 
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.writelines(lines)
+    # Insert the closing after line 984 by joining the two halves around it,
+    # rather than shifting every trailing entry of the list
+    closing = '        )}\n'
+    new_content = ''.join(lines[:984]) + closing + ''.join(lines[984:])
 
-print("\n✅ Fixed!")
+    print("\nLines 975-995 after fix:")
+    show_lines(lines[974:984] + [closing] + lines[984:994], 974)
+
+    return new_content
+
+
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='add_missing_closing') is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("\n✅ Fixed!")
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
+from patch_utils import apply_fix, buffer_output, replace_literals
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
 # Replace openTourModal to show a simple alert with selections
 old_function = '''  const openTourModal = useCallback(() => {
@@ -22,9 +22,14 @@ new_function = '''  const openTourModal = useCallback(() => {
     }
   }, [tourSelection.length]);'''
 
-content = content.replace(old_function, new_function)
 
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
+def transform(content):
+    content, _ = replace_literals(content, [(old_function, new_function)])
+    print("✅ Added debug logging")
+    return content
 
-print("✅ Added debug logging")
+
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='add_simple_display') is None:
+        print(f"✅ {TARGET} already up to date")
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
+from patch_utils import buffer_output, read_source, write_source
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+buffer_output()
+
+content = read_source('src/pages/OptimizedMySqlHome.js')
 
 # Find the exact handler and add tour mode before compare mode check
 old = '''  const handleDaycareSelect = useCallback((daycare, fromComparison = false) => {
@@ -26,7 +28,6 @@ new = '''  const handleDaycareSelect = useCallback((daycare, fromComparison = fa
 
 content = content.replace(old, new)
 
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
+write_source('src/pages/OptimizedMySqlHome.js', content)
 
 print("✅ Added tour mode handling")
@@ -1,18 +1,14 @@
 #!/usr/bin/env python3
 import re
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+from patch_utils import apply_fix, buffer_output, match_bracket
 
-print("Looking for comparison indicator to add tour indicator after it...")
+INDICATOR_ANCHOR = '{/* Comparison Mode Indicator */}'
+ALT_RE = re.compile(r'(\{/\* Daycare Comparison Modal \*/\})')
 
-# Find the comparison mode indicator block
-pattern = r'(\{/\* Comparison Mode Indicator \*/\}\s+\{compareMode && \(.*?\</div\>\s+\</div\>\s+\)\s+\})'
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
-if re.search(pattern, content, re.DOTALL):
-    print("✅ Found comparison indicator")
-    
-    tour_indicator = '''
+TOUR_INDICATOR = '''
       
       {/* Tour Mode Indicator */}
       {tourMode && (
@@ -40,16 +36,8 @@ if re.search(pattern, content, re.DOTALL):
           </div>
         </div>
       )}'''
-    
-    content = re.sub(pattern, r'\1' + tour_indicator, content, flags=re.DOTALL, count=1)
-    print("✅ Tour indicator added")
-else:
-    print("❌ Could not find comparison indicator - trying alternative method")
-    
-    # Alternative: Insert before the DaycareComparison modal
-    alt_pattern = r'(\{/\* Daycare Comparison Modal \*/\})'
-    if re.search(alt_pattern, content):
-        tour_indicator = '''      {/* Tour Mode Indicator */}
+
+ALT_TOUR_INDICATOR = '''      {/* Tour Mode Indicator */}
       {tourMode && (
         <div className="tour-mode-indicator">
           <div className="tour-mode-content">
@@ -76,11 +64,50 @@ else:
         </div>
       )}
       
-      ''' 
-        content = re.sub(alt_pattern, tour_indicator + r'\1', content, count=1)
-        print("✅ Tour indicator added (alternative position)")
+      '''
+
+
+def find_indicator_end(content):
+    """Return the offset just past the comparison indicator block, or -1.
+
+    The block is located from its comment anchor and closed by brace matching,
+    so no lazy DOTALL pattern has to backtrack across the file.
+    """
+    anchor = content.find(INDICATOR_ANCHOR)
+    if anchor == -1:
+        return -1
+    block_start = content.find('{compareMode && (', anchor)
+    # Only whitespace may separate the comment from its block
+    if block_start == -1 or content[anchor + len(INDICATOR_ANCHOR):block_start].strip():
+        return -1
+    block_end = match_bracket(content, block_start)
+    return block_end + 1 if block_end != -1 else -1
+
+
+def transform(content):
+    print("Looking for comparison indicator to add tour indicator after it...")
+
+    # Find the comparison mode indicator block
+    indicator_end = find_indicator_end(content)
+    if indicator_end != -1:
+        print("✅ Found comparison indicator")
+
+        content = content[:indicator_end] + TOUR_INDICATOR + content[indicator_end:]
+        print("✅ Tour indicator added")
+    else:
+        print("❌ Could not find comparison indicator - trying alternative method")
+
+        # Alternative: Insert before the DaycareComparison modal
+        if ALT_RE.search(content):
+            content = ALT_RE.sub(ALT_TOUR_INDICATOR + r'\1', content, count=1)
+            print("✅ Tour indicator added (alternative position)")
+
+    return content
 
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
 
-print("Done!")
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='add_tour_ui') is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("Done!")
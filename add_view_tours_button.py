@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
+from patch_utils import buffer_output, rewrite_file
 
-with open('src/components/UnifiedSearch.js', 'r') as f:
-    content = f.read()
+buffer_output()
 
 print("Adding VIEW TOUR SCHEDULE button...")
 
@@ -55,13 +55,9 @@ new_tour_section = '''        <div className="comparison-controls">
           </div>
         </div>'''
 
-if old_tour_section in content:
-    content = content.replace(old_tour_section, new_tour_section)
+if rewrite_file('src/components/UnifiedSearch.js', [(old_tour_section, new_tour_section)]):
     print("✅ Button added to UnifiedSearch")
 else:
     print("❌ Could not find tour section")
 
-with open('src/components/UnifiedSearch.js', 'w') as f:
-    f.write(content)
-
 print("Done!")
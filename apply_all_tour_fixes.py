@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+import sys
+
+import add_simple_display
+import add_tour_ui
+import cleanup_tour_duplicates
+import complete_tour_fix
+import connect_tour_modal
+import fix_banner_syntax
+import fix_both_toggles
+from patch_utils import buffer_output, run_pipeline, select_steps
+
+TARGET = 'src/pages/OptimizedMySqlHome.js'
+
+# Each step takes the file contents and returns the patched contents, so the
+# whole chain shares a single read and a single write of the target.
+# add_missing_closing is left out: it inserts at a fixed line number, which the
+# steps before it have already moved, so it only runs standalone
+STEPS = [
+    add_simple_display.transform,
+    add_tour_ui.transform,
+    cleanup_tour_duplicates.transform,
+    complete_tour_fix.transform,
+    connect_tour_modal.transform,
+    fix_both_toggles.transform,
+    fix_banner_syntax.transform,
+]
+
+buffer_output()
+# Fix names on the command line run just those steps, in pipeline order; the
+# rerun cache only covers the full chain
+if len(sys.argv) > 1:
+    run_pipeline(TARGET, select_steps(STEPS, sys.argv[1:]))
+else:
+    run_pipeline(TARGET, STEPS, cache_key='apply_all_tour_fixes')
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+import sys
+
+import fix_callback_deps
+import fix_camelcase_payload
+import fix_function_order
+import fix_handle_select
+import fix_modal_props
+import fix_mutual_exclusion
+import fix_optimized_home_final
+import fix_payload_structure
+import fix_tour_handler
+import fix_tour_mode
+from patch_utils import buffer_output, run_pipeline, select_steps
+
+TARGET = 'src/pages/OptimizedMySqlHome.js'
+
+# The fix_* tour mode scripts, in the order they were written to run, chained
+# through a single read and a single write of the target.
+# fix_duplicate_lines is left out: it deletes a fixed line range, which the
+# steps before it have already moved, so it only runs standalone
+STEPS = [
+    fix_tour_mode.transform,
+    fix_function_order.transform,
+    fix_tour_handler.transform,
+    fix_handle_select.transform,
+    fix_callback_deps.transform,
+    fix_mutual_exclusion.transform,
+    fix_modal_props.transform,
+    fix_payload_structure.transform,
+    fix_camelcase_payload.transform,
+    fix_optimized_home_final.transform,
+]
+
+buffer_output()
+# Fix names on the command line run just those steps, in pipeline order; the
+# rerun cache only covers the full chain
+if len(sys.argv) > 1:
+    run_pipeline(TARGET, select_steps(STEPS, sys.argv[1:]))
+else:
+    run_pipeline(TARGET, STEPS, cache_key='apply_all_tour_mode_fixes')
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+import sys
+
+import fix_tour_payload
+import fix_tour_toggle_logic
+import fix_useeffect_position
+import fix_window_globals
+import remove_all_tour_duplicates
+import restore_tour_mode
+from patch_utils import buffer_output, run_pipeline, select_steps
+
+TARGET = 'src/pages/OptimizedMySqlHome.js'
+
+# The scripts that bring tour mode back after it was lost: restore the missing
+# pieces, drop duplicated state, then fix up the globals, their useEffect, the
+# toggle and the submit handler, all through one read and one write
+STEPS = [
+    restore_tour_mode.transform,
+    remove_all_tour_duplicates.transform,
+    fix_window_globals.transform,
+    fix_useeffect_position.transform,
+    fix_tour_toggle_logic.transform,
+    fix_tour_payload.transform,
+]
+
+buffer_output()
+# Fix names on the command line run just those steps, in pipeline order; the
+# rerun cache only covers the full chain
+if len(sys.argv) > 1:
+    run_pipeline(TARGET, select_steps(STEPS, sys.argv[1:]))
+else:
+    run_pipeline(TARGET, STEPS, cache_key='apply_all_tour_restore_fixes')
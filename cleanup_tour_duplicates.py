@@ -1,62 +1,12 @@
 #!/usr/bin/env python3
 import re
+import sys
 
-# Read the file
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
-
-print("Original file size:", len(content))
-
-# First, let's remove ALL tour-related code and start fresh
-# Remove duplicate tour state declarations (keep only the first one)
-# Find all tour state declarations
-tour_state_pattern = r'  // State for tour selection\s+const \[tourMode, setTourMode\] = useState\(false\);\s+const \[tourSelection, setTourSelection\] = useState\(\[\]\);\s+const \[showTourModal, setShowTourModal\] = useState\(false\);'
-
-matches = list(re.finditer(tour_state_pattern, content))
-print(f"Found {len(matches)} tour state declarations")
-
-if len(matches) > 1:
-    # Keep the first one, remove the rest
-    print("Removing duplicate tour state declarations...")
-    for match in reversed(matches[1:]):
-        content = content[:match.start()] + content[match.end():]
-
-# Now fix the handleDaycareSelect function
-# Find the function and rebuild it properly
-handle_select_start = content.find('const handleDaycareSelect = useCallback((daycare, fromComparison = false) => {')
-if handle_select_start == -1:
-    print("ERROR: Could not find handleDaycareSelect function!")
-    exit(1)
-
-# Find the end of the function (look for the closing }, [dependencies])
-# We need to find the matching closing brace
-brace_count = 0
-i = handle_select_start
-function_start = i
-in_function = False
-
-while i < len(content):
-    if content[i] == '{':
-        brace_count += 1
-        in_function = True
-    elif content[i] == '}':
-        brace_count -= 1
-        if in_function and brace_count == 0:
-            # Found the closing brace of useCallback
-            # Now find the dependency array
-            dep_end = content.find(']);', i)
-            if dep_end != -1:
-                function_end = dep_end + 3
-                break
-    i += 1
-
-print(f"Found handleDaycareSelect from {function_start} to {function_end}")
-
-# Extract the current function
-old_function = content[function_start:function_end]
-
-# Build the corrected function
-new_function = '''const handleDaycareSelect = useCallback((daycare, fromComparison = false) => {
+from patch_utils import apply_fix, buffer_output, match_bracket
+
+TARGET = 'src/pages/OptimizedMySqlHome.js'
+
+NEW_FUNCTION = '''const handleDaycareSelect = useCallback((daycare, fromComparison = false) => {
     // If in compare mode and not coming from comparison modal, toggle selection
     if (compareMode && !fromComparison) {
       // Toggle daycare in comparison - if already added, remove it
@@ -159,14 +109,63 @@ new_function = '''const handleDaycareSelect = useCallback((daycare, fromComparis
     document.body.setAttribute('data-previous-scroll', scrollPosition);
   }, [compareMode, initialTabView, isInComparison, addToComparison, removeFromComparison, tourMode, isInTourSelection, addToTourSelection, removeFromTourSelection, tourSelection.length]);'''
 
-# Replace the old function with the new one
-content = content[:function_start] + new_function + content[function_end:]
+TOUR_STATE_RE = re.compile(r'  // State for tour selection\s+const \[tourMode, setTourMode\] = useState\(false\);\s+const \[tourSelection, setTourSelection\] = useState\(\[\]\);\s+const \[showTourModal, setShowTourModal\] = useState\(false\);')
+
+
+def transform(content):
+    print("Original file size:", len(content))
+
+    # First, let's remove ALL tour-related code and start fresh
+    # Remove duplicate tour state declarations (keep only the first one)
+    # Find all tour state declarations; the first one is kept and every later
+    # copy is dropped during the same substitution pass
+    seen = False
+
+    def keep_first(match):
+        nonlocal seen
+        if seen:
+            return ''
+        seen = True
+        return match.group(0)
+
+    content, found = TOUR_STATE_RE.subn(keep_first, content)
+    print(f"Found {found} tour state declarations")
+
+    if found > 1:
+        print("Removing duplicate tour state declarations...")
+
+    # Now fix the handleDaycareSelect function
+    # Find the function and rebuild it properly
+    handle_select_start = content.find('const handleDaycareSelect = useCallback((daycare, fromComparison = false) => {')
+    if handle_select_start == -1:
+        print("ERROR: Could not find handleDaycareSelect function!")
+        sys.exit(1)
+
+    # Find the end of the function (look for the closing }, [dependencies])
+    # The first brace after the declaration opens the useCallback body
+    function_start = handle_select_start
+    body_end = match_bracket(content, content.find('{', function_start))
+    dep_end = content.find(']);', body_end) if body_end != -1 else -1
+    if dep_end == -1:
+        print("ERROR: Could not find the end of handleDaycareSelect!")
+        sys.exit(1)
+    function_end = dep_end + 3
+
+    print(f"Found handleDaycareSelect from {function_start} to {function_end}")
+
+    # Replace the old function with the corrected one
+    content = content[:function_start] + NEW_FUNCTION + content[function_end:]
+
+    print("Cleaned up handleDaycareSelect function")
 
-print("Cleaned up handleDaycareSelect function")
+    return content
 
-# Write the file back
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
 
-print("✅ Duplicates removed and function fixed!")
-print("Final file size:", len(content))
+if __name__ == '__main__':
+    buffer_output()
+    content = apply_fix(TARGET, transform, cache_key='cleanup_tour_duplicates')
+    if content is None:
+        print("✅ Already clean - nothing to do")
+    else:
+        print("✅ Duplicates removed and function fixed!")
+        print("Final file size:", len(content))
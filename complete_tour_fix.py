@@ -1,13 +1,10 @@
 #!/usr/bin/env python3
 import re
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+from patch_utils import apply_fix, buffer_output
 
-print("Fixing useEffect...")
-
-# Find and replace the entire useEffect block
-old_pattern = r'''  // Initialize window global variables for cross-component communication
+# Compile the useEffect patterns once at import
+OLD_EFFECT_RE = re.compile(r'''  // Initialize window global variables for cross-component communication
   useEffect\(\(\) => \{
     // Set window global variables
     window\.daycarealertCompareMode = compareMode;
@@ -26,9 +23,12 @@ old_pattern = r'''  // Initialize window global variables for cross-component co
       window\.toggleTourMode = undefined;
       window\.openTourModal = undefined;
       window\.toggleTourMode = undefined;
-      window\.openTourModal = undefined;'''
+      window\.openTourModal = undefined;''', re.DOTALL)
+OLD_DEPS_RE = re.compile(r'  \}, \[compareMode, daycareComparison\.length, toggleCompareMode, openComparisonModal\]\);')
+
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
-new_useeffect = '''  // Initialize window global variables for cross-component communication
+NEW_USEEFFECT = '''  // Initialize window global variables for cross-component communication
   useEffect(() => {
     // Set window global variables
     window.daycarealertCompareMode = compareMode;
@@ -53,18 +53,26 @@ new_useeffect = '''  // Initialize window global variables for cross-component c
       window.toggleTourMode = undefined;
       window.openTourModal = undefined;'''
 
-content = re.sub(old_pattern, new_useeffect, content, flags=re.DOTALL)
 
-# Now fix the dependency array that follows
-old_deps = r'  \}, \[compareMode, daycareComparison\.length, toggleCompareMode, openComparisonModal\]\);'
-new_deps = '  }, [compareMode, daycareComparison.length, toggleCompareMode, openComparisonModal, tourMode, tourSelection.length, toggleTourMode, openTourModal]);'
+def transform(content):
+    print("Fixing useEffect...")
+
+    # Find and replace the entire useEffect block
+    content = OLD_EFFECT_RE.sub(NEW_USEEFFECT, content)
+
+    # Now fix the dependency array that follows
+    new_deps = '  }, [compareMode, daycareComparison.length, toggleCompareMode, openComparisonModal, tourMode, tourSelection.length, toggleTourMode, openTourModal]);'
+
+    content = OLD_DEPS_RE.sub(new_deps, content)
 
-content = re.sub(old_deps, new_deps, content)
+    print("✅ useEffect fixed")
 
-print("✅ useEffect fixed")
+    return content
 
-# Write the corrected file
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
 
-print("✅ Complete fix applied!")
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='complete_tour_fix') is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("✅ Complete fix applied!")
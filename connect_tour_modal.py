@@ -1,27 +1,34 @@
 #!/usr/bin/env python3
 import re
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+from patch_utils import apply_fix, buffer_output, find_markers
 
-print("1. Adding TourRequestModal import...")
+IMPORT_RE = re.compile(r"(import DaycareComparison from '../components/DaycareComparison';)")
+BANNER_RE = re.compile(r"(\{compareMode && \(\s+<div className=\"comparison-mode-banner\">[^}]+\}\s+\)\s+\})", re.DOTALL)
+MODAL_RE = re.compile(r"(\{showComparisonModal && \(\s+<DaycareComparison[^}]+\}\s+\)\s+\})\s+(</>)", re.DOTALL)
 
-# Add import at the top with other imports
-import_pattern = r"(import DaycareComparison from '../components/DaycareComparison';)"
-new_import = r"\1\nimport TourRequestModal from '../components/TourScheduling/TourRequestModal';"
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
-if "import TourRequestModal" not in content:
-    content = re.sub(import_pattern, new_import, content)
-    print("✅ Import added")
-else:
-    print("✅ Import already exists")
 
-print("2. Adding tour mode banner at top...")
+def transform(content):
+    # Probe for everything already connected in one pass over the file
+    markers = find_markers(content, ["import TourRequestModal", "Tour Mode Banner", "Tour Request Modal"])
 
-# Add tour banner after comparison banner
-banner_pattern = r"(\{compareMode && \(\s+<div className=\"comparison-mode-banner\">[^}]+\}\s+\)\s+\})"
+    print("1. Adding TourRequestModal import...")
 
-tour_banner = r'''\1
+    # Add import at the top with other imports
+    new_import = r"\1\nimport TourRequestModal from '../components/TourScheduling/TourRequestModal';"
+
+    if markers["import TourRequestModal"] == -1:
+        content = IMPORT_RE.sub(new_import, content)
+        print("✅ Import added")
+    else:
+        print("✅ Import already exists")
+
+    print("2. Adding tour mode banner at top...")
+
+    # Add tour banner after comparison banner
+    tour_banner = r'''\1
         
         {/* Tour Mode Banner */}
         {tourMode && (
@@ -34,18 +41,16 @@ tour_banner = r'''\1
           </div>
         )}'''
 
-if "Tour Mode Banner" not in content:
-    content = re.sub(banner_pattern, tour_banner, content, flags=re.DOTALL)
-    print("✅ Banner added")
-else:
-    print("✅ Banner already exists")
+    if markers["Tour Mode Banner"] == -1:
+        content = BANNER_RE.sub(tour_banner, content)
+        print("✅ Banner added")
+    else:
+        print("✅ Banner already exists")
 
-print("3. Adding TourRequestModal component...")
+    print("3. Adding TourRequestModal component...")
 
-# Add modal component before the closing fragment
-modal_pattern = r"(\{showComparisonModal && \(\s+<DaycareComparison[^}]+\}\s+\)\s+\})\s+(</>"
-
-tour_modal = r'''\1
+    # Add modal component before the closing fragment
+    tour_modal = r'''\1
       
       {/* Tour Request Modal */}
       {showTourModal && (
@@ -58,13 +63,18 @@ tour_modal = r'''\1
       
       \2'''
 
-if "Tour Request Modal" not in content:
-    content = re.sub(modal_pattern, tour_modal, content, flags=re.DOTALL)
-    print("✅ Modal component added")
-else:
-    print("✅ Modal already exists")
+    if markers["Tour Request Modal"] == -1:
+        content = MODAL_RE.sub(tour_modal, content)
+        print("✅ Modal component added")
+    else:
+        print("✅ Modal already exists")
+
+    return content
 
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
 
-print("\n✅ All components connected!")
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='connect_tour_modal') is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("\n✅ All components connected!")
@@ -1,32 +1,7 @@
 #!/usr/bin/env python3
-import re
+from patch_utils import bracket_index, buffer_output, find_markers, read_source, write_source
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
-
-print("1. Adding TourRequestModal import...")
-
-# Add import at the top
-if "import TourRequestModal" not in content:
-    import_line = "import TourRequestModal from '../components/TourScheduling/TourRequestModal';"
-    # Find DaycareComparison import and add after it
-    content = content.replace(
-        "import DaycareComparison from '../components/DaycareComparison';",
-        "import DaycareComparison from '../components/DaycareComparison';\n" + import_line
-    )
-    print("✅ Import added")
-else:
-    print("✅ Import already exists")
-
-print("2. Adding tour mode banner...")
-
-# Find the comparison banner and add tour banner after it
-comparison_banner = '''        {/* Visual indicator for comparison mode */}
-        {compareMode && (
-          <div className="comparison-mode-banner">'''
-
-if comparison_banner in content and "Tour Mode Banner" not in content:
-    tour_banner = '''        {/* Visual indicator for comparison mode */}
+TOUR_BANNER = '''        {/* Visual indicator for comparison mode */}
         {compareMode && (
           <div className="comparison-mode-banner">
             <p>
@@ -47,43 +22,8 @@ if comparison_banner in content and "Tour Mode Banner" not in content:
             </p>
           </div>
         )}'''
-    
-    # Find and replace the comparison banner section
-    old_section_start = content.find(comparison_banner)
-    old_section_end = content.find("}", old_section_start) + 1
-    old_section_end = content.find("}", old_section_end) + 1
-    
-    content = content[:old_section_start] + tour_banner + content[old_section_end:]
-    print("✅ Banner added")
-else:
-    print("⚠️ Banner already exists or comparison banner not found")
-
-print("3. Adding TourRequestModal component...")
 
-# Add modal before closing tag
-if "Tour Request Modal" not in content:
-    # Find the DaycareComparison modal
-    comparison_modal_marker = "{showComparisonModal && ("
-    
-    if comparison_modal_marker in content:
-        # Find the end of the comparison modal
-        pos = content.find(comparison_modal_marker)
-        # Find the closing of this block
-        count = 1
-        i = pos + len(comparison_modal_marker)
-        while count > 0 and i < len(content):
-            if content[i] == '(':
-                count += 1
-            elif content[i] == ')':
-                count -= 1
-            i += 1
-        
-        # Find the closing brace and }
-        while i < len(content) and content[i] != '}':
-            i += 1
-        i += 1  # Include the closing }
-        
-        tour_modal = '''
+TOUR_MODAL = '''
       
       {/* Tour Request Modal */}
       {showTourModal && (
@@ -93,15 +33,88 @@ if "Tour Request Modal" not in content:
           onRemove={removeFromTourSelection}
         />
       )}'''
-        
-        content = content[:i] + tour_modal + content[i:]
+
+buffer_output()
+
+content = read_source('src/pages/OptimizedMySqlHome.js')
+
+comparison_import = "import DaycareComparison from '../components/DaycareComparison';"
+comparison_banner = '''        {/* Visual indicator for comparison mode */}
+        {compareMode && (
+          <div className="comparison-mode-banner">'''
+comparison_modal_marker = "{showComparisonModal && ("
+
+# Probe for every anchor and already-applied marker in one pass over the file
+markers = find_markers(content, [
+    "import TourRequestModal",
+    comparison_import,
+    comparison_banner,
+    "Tour Mode Banner",
+    "Tour Request Modal",
+    comparison_modal_marker,
+])
+
+# Match every bracket once so each block below is closed by a lookup. All
+# offsets refer to the content as read; the edits are spliced in at the end.
+braces = bracket_index(content, '{}')
+parens = bracket_index(content, '()')
+edits = []
+
+print("1. Adding TourRequestModal import...")
+
+# Add import at the top
+if markers["import TourRequestModal"] == -1:
+    import_line = "import TourRequestModal from '../components/TourScheduling/TourRequestModal';"
+    # Find DaycareComparison import and add after it
+    if markers[comparison_import] != -1:
+        import_end = markers[comparison_import] + len(comparison_import)
+        edits.append((import_end, import_end, "\n" + import_line))
+    print("✅ Import added")
+else:
+    print("✅ Import already exists")
+
+print("2. Adding tour mode banner...")
+
+# Find the comparison banner and add tour banner after it, up to the brace
+# closing its {compareMode && (...)} block; -1 when the block is never closed
+old_section_end = -1
+if markers[comparison_banner] != -1 and markers["Tour Mode Banner"] == -1:
+    old_section_start = markers[comparison_banner]
+    old_section_end = braces.get(content.find('{compareMode', old_section_start), -1)
+
+if old_section_end != -1:
+    # Find and replace the comparison banner section
+    edits.append((old_section_start, old_section_end + 1, TOUR_BANNER))
+    print("✅ Banner added")
+else:
+    print("⚠️ Banner already exists or comparison banner not found")
+
+print("3. Adding TourRequestModal component...")
+
+# Add modal before closing tag
+if markers["Tour Request Modal"] == -1:
+    # Find the end of the comparison modal: the paren closing its opening "("
+    # and then the closing }; -1 when either is missing
+    modal_end = -1
+    if markers[comparison_modal_marker] != -1:
+        pos = markers[comparison_modal_marker]
+        close_paren = parens.get(pos + len(comparison_modal_marker) - 1, -1)
+        if close_paren != -1:
+            modal_end = content.find('}', close_paren)
+
+    if modal_end != -1:
+        i = modal_end + 1
+        edits.append((i, i, TOUR_MODAL))
         print("✅ Modal component added")
     else:
         print("❌ Could not find comparison modal marker")
 else:
     print("✅ Modal already exists")
 
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
+# Splice from the bottom up so earlier offsets stay valid
+for start, end, text in sorted(edits, reverse=True):
+    content = content[:start] + text + content[end:]
+
+write_source('src/pages/OptimizedMySqlHome.js', content)
 
 print("\n✅ Done!")
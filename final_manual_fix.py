@@ -1,7 +1,41 @@
 #!/usr/bin/env python3
+from itertools import accumulate, islice
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    lines = f.readlines()
+from patch_utils import buffer_output, read_lines, write_source
+
+# Corrected window-globals useEffect, spliced in over the old one
+USEEFFECT_LINES = [
+    '  // Initialize window global variables for cross-component communication\n',
+    '  useEffect(() => {\n',
+    '    // Set window global variables\n',
+    '    window.daycarealertCompareMode = compareMode;\n',
+    '    window.daycareComparisonCount = daycareComparison.length;\n',
+    '    window.toggleCompareMode = toggleCompareMode;\n',
+    '    window.openComparisonModal = openComparisonModal;\n',
+    '    \n',
+    '    // Tour mode globals\n',
+    '    window.daycarealertTourMode = tourMode;\n',
+    '    window.tourSelectionCount = tourSelection.length;\n',
+    '    window.toggleTourMode = toggleTourMode;\n',
+    '    window.openTourModal = openTourModal;\n',
+    '    \n',
+    '    // Clean up global variables when component unmounts\n',
+    '    return () => {\n',
+    '      window.daycarealertCompareMode = undefined;\n',
+    '      window.daycareComparisonCount = undefined;\n',
+    '      window.toggleCompareMode = undefined;\n',
+    '      window.openComparisonModal = undefined;\n',
+    '      window.daycarealertTourMode = undefined;\n',
+    '      window.tourSelectionCount = undefined;\n',
+    '      window.toggleTourMode = undefined;\n',
+    '      window.openTourModal = undefined;\n',
+    '    };\n',
+    '  }, [compareMode, daycareComparison.length, toggleCompareMode, openComparisonModal, tourMode, tourSelection.length, toggleTourMode, openTourModal]);\n',
+]
+
+buffer_output()
+
+lines = read_lines('src/pages/OptimizedMySqlHome.js')
 
 print(f"Total lines: {len(lines)}")
 
@@ -17,69 +51,29 @@ if len(lines) > 738:
         print("✅ Duplicate removed")
 
 # Now fix the useEffect section
-new_lines = []
-skip_until = -1
-in_useeffect = False
-useeffect_fixed = False
+marker = '// Initialize window global variables for cross-component communication'
+i = next((i for i, line in enumerate(lines) if marker in line), None)
+
+if i is None:
+    new_lines = lines
+else:
+    # Find the end of this useEffect: the first line from here that brings
+    # the brace depth back to zero and closes the deps. The running depth
+    # is accumulated lazily from this line, so counting stops at the block end
+    depths = accumulate(line.count('{') - line.count('}') for line in islice(lines, i, None))
+    end_line = next(
+        (j for j, depth in enumerate(depths, start=i) if depth == 0 and ']);' in lines[j]),
+        i
+    )
+
+    print(f"Found useEffect from line {i+1} to {end_line+1}")
 
-for i, line in enumerate(lines):
-    if skip_until > i:
-        continue
-    
-    # Find the useEffect that needs fixing
-    if '// Initialize window global variables for cross-component communication' in line and not useeffect_fixed:
-        in_useeffect = True
-        # Find the end of this useEffect
-        brace_count = 0
-        end_line = i
-        for j in range(i, len(lines)):
-            if '{' in lines[j]:
-                brace_count += lines[j].count('{')
-            if '}' in lines[j]:
-                brace_count -= lines[j].count('}')
-            if brace_count == 0 and ']);' in lines[j]:
-                end_line = j
-                break
-        
-        print(f"Found useEffect from line {i+1} to {end_line+1}")
-        
-        # Replace with corrected useEffect
-        new_lines.append('  // Initialize window global variables for cross-component communication\n')
-        new_lines.append('  useEffect(() => {\n')
-        new_lines.append('    // Set window global variables\n')
-        new_lines.append('    window.daycarealertCompareMode = compareMode;\n')
-        new_lines.append('    window.daycareComparisonCount = daycareComparison.length;\n')
-        new_lines.append('    window.toggleCompareMode = toggleCompareMode;\n')
-        new_lines.append('    window.openComparisonModal = openComparisonModal;\n')
-        new_lines.append('    \n')
-        new_lines.append('    // Tour mode globals\n')
-        new_lines.append('    window.daycarealertTourMode = tourMode;\n')
-        new_lines.append('    window.tourSelectionCount = tourSelection.length;\n')
-        new_lines.append('    window.toggleTourMode = toggleTourMode;\n')
-        new_lines.append('    window.openTourModal = openTourModal;\n')
-        new_lines.append('    \n')
-        new_lines.append('    // Clean up global variables when component unmounts\n')
-        new_lines.append('    return () => {\n')
-        new_lines.append('      window.daycarealertCompareMode = undefined;\n')
-        new_lines.append('      window.daycareComparisonCount = undefined;\n')
-        new_lines.append('      window.toggleCompareMode = undefined;\n')
-        new_lines.append('      window.openComparisonModal = undefined;\n')
-        new_lines.append('      window.daycarealertTourMode = undefined;\n')
-        new_lines.append('      window.tourSelectionCount = undefined;\n')
-        new_lines.append('      window.toggleTourMode = undefined;\n')
-        new_lines.append('      window.openTourModal = undefined;\n')
-        new_lines.append('    };\n')
-        new_lines.append('  }, [compareMode, daycareComparison.length, toggleCompareMode, openComparisonModal, tourMode, tourSelection.length, toggleTourMode, openTourModal]);\n')
-        
-        skip_until = end_line + 1
-        useeffect_fixed = True
-        print("✅ useEffect replaced")
-        continue
-    
-    new_lines.append(line)
+    # Replace with corrected useEffect, assembling the result from slices
+    # rather than appending the untouched lines one at a time
+    new_lines = lines[:i] + USEEFFECT_LINES + lines[end_line + 1:]
+    print("✅ useEffect replaced")
 
 # Write back
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.writelines(new_lines)
+write_source('src/pages/OptimizedMySqlHome.js', ''.join(new_lines))
 
 print(f"✅ File updated! New line count: {len(new_lines)}")
@@ -1,35 +1,9 @@
 #!/usr/bin/env python3
+from patch_utils import apply_fix, buffer_output, match_bracket, show_lines, split_lines
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    lines = f.readlines()
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
-print(f"Total lines: {len(lines)}")
-
-# Find the problematic section around line 985
-for i in range(975, min(995, len(lines))):
-    print(f"Line {i+1}: {lines[i].rstrip()}")
-
-# The issue is likely duplicate banner code. Let's find and fix it
-content = ''.join(lines)
-
-# Remove any duplicate or broken banner code
-# Look for the pattern and replace with correct version
-import re
-
-# Find all tour mode banner occurrences
-pattern = r'\{/\* Tour Mode Banner \*/\}.*?\{tourMode && \(.*?\)\s+\}'
-
-matches = list(re.finditer(pattern, content, re.DOTALL))
-print(f"\nFound {len(matches)} Tour Mode Banner blocks")
-
-if len(matches) > 1:
-    print("Removing duplicates...")
-    # Keep only the first one
-    for match in reversed(matches[1:]):
-        content = content[:match.start()] + content[match.end():]
-
-# Now ensure the banner is correct
-correct_banner = '''        {/* Tour Mode Banner */}
+CORRECT_BANNER = '''        {/* Tour Mode Banner */}
         {tourMode && (
           <div className="tour-mode-banner">
             <p>
@@ -40,16 +14,73 @@ correct_banner = '''        {/* Tour Mode Banner */}
           </div>
         )}'''
 
-# Replace any tour banner with the correct one
-content = re.sub(
-    r'\{/\* Tour Mode Banner \*/\}.*?\{tourMode && \(.*?\)\s+\}',
-    correct_banner,
-    content,
-    flags=re.DOTALL,
-    count=1
-)
+BANNER_ANCHOR = '{/* Tour Mode Banner */}'
+BANNER_BLOCK = '{tourMode && ('
+
+
+def find_banners(content):
+    """Return the (start, end) span of every Tour Mode Banner block.
+
+    Each span runs from the banner comment to the brace closing the
+    {tourMode && (...)} block after it, found by bracket matching rather than
+    a lazy DOTALL pattern that has to guess where the block stops.
+    """
+    spans = []
+    start = content.find(BANNER_ANCHOR)
+    while start != -1:
+        block_start = content.find(BANNER_BLOCK, start)
+        if block_start == -1:
+            break
+        # Only whitespace may separate the comment from its block; a stray
+        # comment is skipped rather than paired with a block further on
+        if content[start + len(BANNER_ANCHOR):block_start].strip():
+            start = content.find(BANNER_ANCHOR, start + len(BANNER_ANCHOR))
+            continue
+        block_end = match_bracket(content, block_start)
+        if block_end == -1:
+            break
+        spans.append((start, block_end + 1))
+        start = content.find(BANNER_ANCHOR, block_end + 1)
+    return spans
+
+
+def transform(content):
+    lines = split_lines(content)
+
+    print(f"Total lines: {len(lines)}")
+
+    # Find the problematic section around line 985
+    show_lines(lines[975:995], 975)
+
+    # The issue is likely duplicate banner code. Let's find and fix it
+
+    # Remove any duplicate or broken banner code
+    # Look for the pattern and replace with correct version
+
+    # Find all tour mode banner occurrences
+    banners = find_banners(content)
+    print(f"\nFound {len(banners)} Tour Mode Banner blocks")
+
+    if len(banners) > 1:
+        print("Removing duplicates...")
+        # Keep only the first one
+        for start, end in reversed(banners[1:]):
+            content = content[:start] + content[end:]
+
+    # Now ensure the banner is correct
+
+    # Replace the first tour banner with the correct one; the duplicates
+    # removed above all came after it, so its span is still valid
+    if banners:
+        start, end = banners[0]
+        content = content[:start] + CORRECT_BANNER + content[end:]
+
+    return content
 
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
 
-print("\n✅ Fixed!")
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='fix_banner_syntax') is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("\n✅ Fixed!")
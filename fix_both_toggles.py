@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
+from patch_utils import apply_fix, buffer_output, replace_literals
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
 # Fix toggleCompareMode with same pattern
 old_compare = '''  const toggleCompareMode = useCallback(() => {
@@ -37,9 +37,14 @@ new_compare = '''  const toggleCompareMode = useCallback(() => {
       return newValue;
     });'''
 
-content = content.replace(old_compare, new_compare)
 
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
+def transform(content):
+    content, _ = replace_literals(content, [(old_compare, new_compare)])
+    print("✅ Fixed comparison toggle!")
+    return content
 
-print("✅ Fixed comparison toggle!")
+
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='fix_both_toggles') is None:
+        print(f"✅ {TARGET} already up to date")
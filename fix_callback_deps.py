@@ -1,25 +1,32 @@
 #!/usr/bin/env python3
+from patch_utils import apply_fix, buffer_output, match_bracket
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
-# Find the handleDaycareSelect useCallback and update its dependencies
-import re
+HANDLE_SELECT = 'const handleDaycareSelect = useCallback('
+TOUR_DEPS = ', tourMode, addToTourSelection, removeFromTourSelection, isInTourSelection'
 
-# Find the pattern
-pattern = r'(const handleDaycareSelect = useCallback\([^}]+\}, \[)([^\]]+)(\]\);)'
 
-def add_tour_deps(match):
-    deps = match.group(2)
-    # Add tour dependencies if not already there
-    if 'tourMode' not in deps:
-        new_deps = deps + ', tourMode, addToTourSelection, removeFromTourSelection, isInTourSelection'
-        return match.group(1) + new_deps + match.group(3)
-    return match.group(0)
+def transform(content):
+    # Find the handleDaycareSelect useCallback and update its dependencies. The
+    # dependency list is the last [...] inside the useCallback(...) call, so it is
+    # located by matching the call's parens instead of a DOTALL regex
+    start = content.find(HANDLE_SELECT)
+    call_end = match_bracket(content, start + len(HANDLE_SELECT) - 1, '()') if start != -1 else -1
 
-content = re.sub(pattern, add_tour_deps, content, flags=re.DOTALL)
+    if call_end != -1:
+        deps_close = content.rfind(']', start, call_end)
+        deps_open = content.rfind('[', start, deps_close) if deps_close != -1 else -1
+        # Add tour dependencies if not already there
+        if deps_open != -1 and 'tourMode' not in content[deps_open:deps_close]:
+            content = content[:deps_close] + TOUR_DEPS + content[deps_close:]
 
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
+    return content
 
-print("✅ Fixed callback dependencies")
+
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='fix_callback_deps') is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("✅ Fixed callback dependencies")
@@ -1,38 +1,45 @@
 #!/usr/bin/env python3
+from patch_utils import apply_fix, buffer_output, match_bracket, replace_literals
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
-
-# Fix the parentInfo object to use camelCase
-old_parentinfo = '''              parentInfo: {
-                parent_name: formData.parentName,
-                parent_email: formData.parentEmail,
-                parent_phone: formData.parentPhone,
-                parent_address: formData.parentAddress || '',
-                number_of_children: formData.numberOfChildren,
-                children_ages: JSON.stringify(formData.childrenAges),
-                preferred_start_date: formData.preferredStartDate,
-                available_days: JSON.stringify(formData.availableDays),
-                preferred_time_slots: formData.preferredTimeSlots.join(', '),
-                additional_notes: formData.additionalNotes || ''
-              },'''
-
-new_parentinfo = '''              parentInfo: {
-                parentName: formData.parentName,
-                parentEmail: formData.parentEmail,
-                parentPhone: formData.parentPhone,
-                parentAddress: formData.parentAddress || '',
-                numberOfChildren: formData.numberOfChildren,
-                childrenAges: formData.childrenAges,
-                preferredStartDate: formData.preferredStartDate,
-                availableDays: formData.availableDays,
-                preferredTimeSlots: formData.preferredTimeSlots,
-                additionalNotes: formData.additionalNotes || ''
-              },'''
-
-content = content.replace(old_parentinfo, new_parentinfo)
-
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
-
-print("✅ Changed to camelCase property names!")
+TARGET = 'src/pages/OptimizedMySqlHome.js'
+
+PARENT_INFO = 'parentInfo: {'
+
+# Fix the parentInfo object to use camelCase. Only the keys (and the two values
+# that were stringified or joined) differ, so just those tokens are rewritten
+RENAMES = [
+    ('parent_name:', 'parentName:'),
+    ('parent_email:', 'parentEmail:'),
+    ('parent_phone:', 'parentPhone:'),
+    ('parent_address:', 'parentAddress:'),
+    ('number_of_children:', 'numberOfChildren:'),
+    ('children_ages: JSON.stringify(formData.childrenAges)', 'childrenAges: formData.childrenAges'),
+    ('preferred_start_date:', 'preferredStartDate:'),
+    ('available_days: JSON.stringify(formData.availableDays)', 'availableDays: formData.availableDays'),
+    ("preferred_time_slots: formData.preferredTimeSlots.join(', ')", 'preferredTimeSlots: formData.preferredTimeSlots'),
+    ('additional_notes:', 'additionalNotes:'),
+]
+
+
+def transform(content):
+    # Rename within the first parentInfo block still using snake_case, each block
+    # found by matching its braces
+    start = content.find(PARENT_INFO)
+    while start != -1:
+        end = match_bracket(content, start + len(PARENT_INFO) - 1)
+        if end == -1:
+            break
+        block, count = replace_literals(content[start:end], RENAMES)
+        if count:
+            return content[:start] + block + content[end:]
+        start = content.find(PARENT_INFO, end)
+
+    return content
+
+
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='fix_camelcase_payload') is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("✅ Changed to camelCase property names!")
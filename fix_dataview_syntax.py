@@ -1,23 +1,38 @@
 #!/usr/bin/env python3
+import re
+from itertools import islice
 
-with open('src/components/DaycareDataView.js', 'r') as f:
-    lines = f.readlines()
+from patch_utils import map_bytes, show_lines
+
+# A line mentioning typeof ratingToUse, paired with the line before it. The
+# current line is only looked ahead at, so back-to-back matches still pair up
+TYPEOF_RE = re.compile(rb'^([^\n]*)\n(?=([^\n]*typeof ratingToUse[^\n]*))', re.MULTILINE)
+
+# A previous line is incomplete when its last non-blank character is not ; { or }
+INCOMPLETE_RE = re.compile(rb'[^;{}\s]\s*\Z')
+
+# Only lines 200-210 are inspected (index 199 is the line before the first
+# candidate), so map the file and keep just that window; the lines before it
+# are stepped over without being decoded or stored
+FIRST = 199
+with map_bytes('src/components/DaycareDataView.js') as mm:
+    lines = list(islice(iter(mm.readline, b''), FIRST, 210)) if mm else []
 
 # Find line 204 (index 203)
 print("Line 202-208:")
-for i in range(201, 208):
-    if i < len(lines):
-        print(f"{i+1}: {lines[i].rstrip()}")
+show_lines([line.decode('utf-8') for line in lines[201 - FIRST:208 - FIRST]], 201, prefix='')
 
 # The issue is line 204 starts with "typeof" which means something before it was removed
-# Let's look for the incomplete statement
-for i in range(200, 210):
-    if i < len(lines) and 'typeof ratingToUse' in lines[i]:
-        print(f"\nFound problematic line at {i+1}")
-        print(f"Previous line: {lines[i-1].rstrip()}")
-        print(f"Current line: {lines[i].rstrip()}")
-        
-        # Check if previous line looks incomplete
-        prev = lines[i-1].strip()
-        if prev and not prev.endswith((';', '{', '}')):
-            print("⚠️  Previous line looks incomplete!")
+# Let's look for the incomplete statement, scanning the window's raw bytes in
+# one pass rather than stripping and testing each line in Python
+window = b''.join(lines)
+for match in TYPEOF_RE.finditer(window):
+    prev, current = match.groups()
+    number = FIRST + window.count(b'\n', 0, match.end()) + 1
+    print(f"\nFound problematic line at {number}")
+    print(f"Previous line: {prev.decode('utf-8').rstrip()}")
+    print(f"Current line: {current.decode('utf-8').rstrip()}")
+
+    # Check if previous line looks incomplete
+    if INCOMPLETE_RE.search(prev):
+        print("⚠️  Previous line looks incomplete!")
@@ -1,28 +1,38 @@
 #!/usr/bin/env python3
+from patch_utils import apply_fix, buffer_output, count_lines, line_offset, show_lines, split_lines
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    lines = f.readlines()
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
-# Lines 985-989 are duplicates that need to be removed
-# Line 984 is:           </div>
-# Line 985 should be:         )}
-# But instead we have extra junk on 985-989
 
-# Remove lines 985-989 (indices 984-988)
-print(f"Original line count: {len(lines)}")
-print("Removing duplicate lines 985-989...")
+def transform(content):
+    # Lines 985-989 are duplicates that need to be removed
+    # Line 984 is:           </div>
+    # Line 985 should be:         )}
+    # But instead we have extra junk on 985-989
 
-# Delete the duplicate lines
-del lines[984:989]
+    # Remove lines 985-989 (indices 984-988)
+    print(f"Original line count: {count_lines(content)}")
+    print("Removing duplicate lines 985-989...")
 
-print(f"New line count: {len(lines)}")
+    # Delete the duplicate lines by slicing around their offsets, so the rest
+    # of the file is never split into lines
+    start = line_offset(content, 984)
+    end = line_offset(content, 5, start)
+    content = content[:start] + content[end:]
 
-# Verify the fix
-print("\nLines 975-995 after fix:")
-for i in range(974, min(995, len(lines))):
-    print(f"Line {i+1}: {lines[i].rstrip()}")
+    print(f"New line count: {count_lines(content)}")
 
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.writelines(lines)
+    # Verify the fix
+    print("\nLines 975-995 after fix:")
+    window_start = line_offset(content, 974)
+    show_lines(split_lines(content[window_start:line_offset(content, 21, window_start)]), 974)
 
-print("\n✅ Duplicates removed!")
+    return content
+
+
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='fix_duplicate_lines') is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("\n✅ Duplicates removed!")
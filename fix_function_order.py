@@ -1,44 +1,58 @@
 #!/usr/bin/env python3
+import re
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+from patch_utils import apply_fix, buffer_output, drop_spans
 
-# We need to move the tour functions to come BEFORE the useEffect that uses them
-# Find where comparison functions end (removeFromComparison)
-# Insert tour functions right after that, BEFORE the useEffect
+TARGET = 'src/pages/OptimizedMySqlHome.js'
+
+# The tour functions block, from toggleTourMode through closeTourModal
+TOUR_FUNCTIONS_RE = re.compile(r'(  // Toggle tour mode\s+const toggleTourMode = useCallback.*?  const closeTourModal = useCallback\(\(\) => \{.*?\}, \[\]\);)', re.DOTALL)
+# removeFromComparison and the whitespace after it, where the block belongs
+INSERT_AFTER_RE = re.compile(r'(const removeFromComparison = useCallback\([^}]+\}, \[daycareComparison\]\);)\s+')
+
+
+def transform(content):
+    # We need to move the tour functions to come BEFORE the useEffect that uses them
+    # Find where comparison functions end (removeFromComparison)
+    # Insert tour functions right after that, BEFORE the useEffect
+
+    # Find the tour function definitions
+    tour_match = TOUR_FUNCTIONS_RE.search(content)
+
+    if tour_match:
+        print("Found tour functions")
+        tour_functions = tour_match.group(1)
+        moved = '\n\n' + tour_functions + '\n\n  '
+
+        # Remove every copy of the block from its current location, not
+        # only the one matched, so no declaration is left behind twice
+        spans = []
+        start = tour_match.start()
+        while start != -1:
+            end = start + len(tour_functions)
+            spans.append((start, end))
+            start = content.find(tour_functions, end)
+        content = drop_spans(content, spans)
+
+        # Find where to insert them (after removeFromComparison, before the
+        # useEffect) and splice the block in by offset
+        insert_match = INSERT_AFTER_RE.search(content)
+        if insert_match is not None:
+            content = content[:insert_match.end(1)] + moved + content[insert_match.end():]
+
+        print("✅ Tour functions moved before useEffect")
+    else:
+        print("Could not find tour functions - trying different approach")
+
+        # Alternative: Find tour functions by finding toggleTourMode
+        # and move everything between toggleTourMode and closeTourModal
+
+    return content
 
-import re
 
-# Find the tour function definitions
-tour_functions_pattern = r'(  // Toggle tour mode\s+const toggleTourMode = useCallback.*?  const closeTourModal = useCallback\(\(\) => \{.*?\}, \[\]\);)'
-tour_match = re.search(tour_functions_pattern, content, re.DOTALL)
-
-if tour_match:
-    print("Found tour functions")
-    tour_functions = tour_match.group(1)
-    
-    # Remove tour functions from their current location
-    content = content.replace(tour_functions, '')
-    
-    # Find where to insert them (after removeFromComparison, before useEffect)
-    insert_pattern = r'(const removeFromComparison = useCallback\([^}]+\}, \[daycareComparison\]\);)\s+'
-    
-    # Insert tour functions at the correct location
-    content = re.sub(
-        insert_pattern,
-        r'\1\n\n' + tour_functions + '\n\n  ',
-        content,
-        count=1
-    )
-    
-    print("✅ Tour functions moved before useEffect")
-else:
-    print("Could not find tour functions - trying different approach")
-    
-    # Alternative: Find tour functions by finding toggleTourMode
-    # and move everything between toggleTourMode and closeTourModal
-    
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
-
-print("Done!")
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='fix_function_order') is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("Done!")
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
+from patch_utils import apply_fix, buffer_output, splice_once
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
 # Find handleDaycareSelect and add tour mode check at the beginning
 old_handler = '''  const handleDaycareSelect = useCallback((daycare, fromComparison = false) => {
@@ -22,16 +22,28 @@ new_handler = '''  const handleDaycareSelect = useCallback((daycare, fromCompari
     
     if (fromComparison || compareMode) {'''
 
-if old_handler in content:
-    content = content.replace(old_handler, new_handler)
-    print("✅ Added tour mode handling to handleDaycareSelect")
-else:
-    print("❌ Could not find handleDaycareSelect pattern")
-    print("Let me check what's there...")
-    import re
-    match = re.search(r'const handleDaycareSelect = useCallback.*?\{', content, re.DOTALL)
-    if match:
-        print("Found:", match.group(0)[:200])
-
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
+
+def transform(content):
+    # splice_once hands back the same object when old_handler is missing, so the
+    # miss is detected without a separate `in` scan first
+    patched = splice_once(content, old_handler, new_handler)
+    if patched is not content:
+        content = patched
+        print("✅ Added tour mode handling to handleDaycareSelect")
+    else:
+        print("❌ Could not find handleDaycareSelect pattern")
+        print("Let me check what's there...")
+        # Show the declaration up to the first brace after it
+        prefix = 'const handleDaycareSelect = useCallback'
+        start = content.find(prefix)
+        brace = content.find('{', start + len(prefix)) if start != -1 else -1
+        if brace != -1:
+            print("Found:", content[start:brace + 1][:200])
+
+    return content
+
+
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='fix_handle_select') is None:
+        print(f"✅ {TARGET} already up to date")
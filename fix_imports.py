@@ -1,30 +1,44 @@
 #!/usr/bin/env python3
+import re
 
-with open('src/App.js', 'r') as f:
-    content = f.read()
+from patch_utils import atomic_write, map_bytes
 
-# Check if imports exist
-has_commission = 'import CommissionDashboard' in content
-has_enrollment = 'import EnrollmentConfirmation' in content
+IMPORT_RE = re.compile(rb'import (CommissionDashboard|EnrollmentConfirmation)')
+
+# Check which imports exist in a single pass over the mapped bytes, stopping
+# once both are seen; App.js is only read when an import actually has to be added
+found = set()
+with map_bytes('src/App.js') as mm:
+    for match in IMPORT_RE.finditer(mm):
+        found.add(match.group(1))
+        if len(found) == 2:
+            break
+
+has_commission = b'CommissionDashboard' in found
+has_enrollment = b'EnrollmentConfirmation' in found
 
 print(f"CommissionDashboard imported: {has_commission}")
 print(f"EnrollmentConfirmation imported: {has_enrollment}")
 
 if not has_commission or not has_enrollment:
+    # The edit is ASCII-only, so it is made on the raw bytes with no decode,
+    # newline translation or re-encode on the way in or out
+    with open('src/App.js', 'rb') as f:
+        content = f.read()
+
     # Find the import section (after the last import statement before the function)
     # Add after the last page import
-    import_line = "import ApiDocs from './pages/ApiDocs';"
+    import_line = b"import ApiDocs from './pages/ApiDocs';"
     
     new_imports = import_line
     if not has_enrollment:
-        new_imports += "\nimport EnrollmentConfirmation from './pages/EnrollmentConfirmation';"
+        new_imports += b"\nimport EnrollmentConfirmation from './pages/EnrollmentConfirmation';"
     if not has_commission:
-        new_imports += "\nimport CommissionDashboard from './pages/CommissionDashboard';"
+        new_imports += b"\nimport CommissionDashboard from './pages/CommissionDashboard';"
     
     content = content.replace(import_line, new_imports)
     
-    with open('src/App.js', 'w') as f:
-        f.write(content)
+    atomic_write('src/App.js', content)
     
     print("✅ Added missing imports")
 else:
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
+from patch_utils import apply_fix, buffer_output, splice_once
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
 # Find the current modal render
 old_modal = '''      {/* Tour Request Modal */}
@@ -26,9 +26,16 @@ new_modal = '''      {/* Tour Request Modal */}
         }}
       />'''
 
-content = content.replace(old_modal, new_modal)
 
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
+def transform(content):
+    content = splice_once(content, old_modal, new_modal)
 
-print("✅ Modal props fixed!")
+    return content
+
+
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='fix_modal_props') is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("✅ Modal props fixed!")
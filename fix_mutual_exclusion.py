@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
+from patch_utils import apply_fix, buffer_output, splice_once
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
 # Fix toggleTourMode to disable compare mode
 old_tour = '''  const toggleTourMode = useCallback(() => {
@@ -22,8 +22,6 @@ new_tour = '''  const toggleTourMode = useCallback(() => {
     }
   }, [tourMode]);'''
 
-content = content.replace(old_tour, new_tour)
-
 # Fix toggleCompareMode to disable tour mode
 old_compare = '''  const toggleCompareMode = useCallback(() => {
     const newCompareMode = !compareMode;
@@ -49,9 +47,18 @@ new_compare = '''  const toggleCompareMode = useCallback(() => {
       setTourMode(false);
       setTourSelection([]);'''
 
-content = content.replace(old_compare, new_compare)
 
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
+def transform(content):
+    content = splice_once(content, old_tour, new_tour)
+
+    content = splice_once(content, old_compare, new_compare)
+
+    return content
+
 
-print("✅ Made modes mutually exclusive!")
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='fix_mutual_exclusion') is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("✅ Made modes mutually exclusive!")
@@ -1,24 +1,14 @@
 #!/usr/bin/env python3
 import re
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+from patch_utils import apply_fix, buffer_output
 
-print("Fixing OptimizedMySqlHome.js...")
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
-# Find all tour state declarations
-matches = list(re.finditer(r'  const \[tourMode, setTourMode\] = useState\(false\);\s+const \[tourSelection, setTourSelection\] = useState\(\[\]\);\s+const \[showTourModal, setShowTourModal\] = useState\(false\);', content))
+TOUR_STATE_RE = re.compile(r'  const \[tourMode, setTourMode\] = useState\(false\);\s+const \[tourSelection, setTourSelection\] = useState\(\[\]\);\s+const \[showTourModal, setShowTourModal\] = useState\(false\);')
 
-print(f"Found {len(matches)} tour state declarations")
-
-# Remove duplicates (keep only the first one at line ~27)
-if len(matches) > 1:
-    for match in reversed(matches[1:]):
-        print(f"Removing duplicate at position {match.start()}")
-        content = content[:match.start()] + content[match.end():]
-
-# Fix the useEffect - replace the entire block
-old_useeffect = r'''  // Initialize window global variables for cross-component communication
+# The useEffect as it was left with duplicated tour globals
+OLD_USEEFFECT_RE = re.compile(r'''  // Initialize window global variables for cross-component communication
   useEffect\(\(\) => \{
     // Set window global variables
     window\.daycarealertCompareMode = compareMode;
@@ -40,8 +30,9 @@ old_useeffect = r'''  // Initialize window global variables for cross-component
       window\.openTourModal = undefined;
       window\.openComparisonModal = undefined;
     \};
-  \}, \[compareMode, daycareComparison\.length, toggleCompareMode, openComparisonModal, tourMode, tourSelection\.length, toggleTourMode, openTourModal\]\);'''
+  \}, \[compareMode, daycareComparison\.length, toggleCompareMode, openComparisonModal, tourMode, tourSelection\.length, toggleTourMode, openTourModal\]\);''', re.DOTALL)
 
+# Fix the useEffect - replace the entire block
 new_useeffect = '''  // Initialize window global variables for cross-component communication
   useEffect(() => {
     // Set window global variables
@@ -69,9 +60,29 @@ new_useeffect = '''  // Initialize window global variables for cross-component c
     };
   }, [compareMode, daycareComparison.length, toggleCompareMode, openComparisonModal, tourMode, tourSelection.length, toggleTourMode, openTourModal]);'''
 
-content = re.sub(old_useeffect, new_useeffect, content, flags=re.DOTALL)
 
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
+def transform(content):
+    print("Fixing OptimizedMySqlHome.js...")
+
+    # Find all tour state declarations
+    matches = list(TOUR_STATE_RE.finditer(content))
+
+    print(f"Found {len(matches)} tour state declarations")
+
+    # Remove duplicates (keep only the first one at line ~27)
+    if len(matches) > 1:
+        for match in reversed(matches[1:]):
+            print(f"Removing duplicate at position {match.start()}")
+            content = content[:match.start()] + content[match.end():]
+
+    content = OLD_USEEFFECT_RE.sub(new_useeffect, content)
+
+    return content
+
 
-print("✅ All duplicates removed and useEffect fixed!")
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='fix_optimized_home_final') is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("✅ All duplicates removed and useEffect fixed!")
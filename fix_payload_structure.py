@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
+from patch_utils import apply_fix, buffer_output, splice_once
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
 # Replace the payload construction
 old_payload = '''            const payload = {
@@ -49,11 +49,19 @@ new_payload = '''            const payload = {
               }))
             };'''
 
-if old_payload in content:
-    content = content.replace(old_payload, new_payload)
-    print("✅ Payload structure fixed!")
-else:
-    print("❌ Could not find exact payload match")
 
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
+def transform(content):
+    patched = splice_once(content, old_payload, new_payload)
+    if patched is not content:
+        content = patched
+        print("✅ Payload structure fixed!")
+    else:
+        print("❌ Could not find exact payload match")
+
+    return content
+
+
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='fix_payload_structure') is None:
+        print(f"✅ {TARGET} already up to date")
@@ -1,16 +1,23 @@
 #!/usr/bin/env python3
 import re
 
-with open('src/components/UnifiedSearch.js', 'r') as f:
-    content = f.read()
+from patch_utils import apply_fix, buffer_output
+
+TARGET = 'src/components/UnifiedSearch.js'
 
 # Find the tour button and add onClick
-old_button = r'(<button[^>]*className="unified-search-button tour-button"[^>]*>)\s*\{window\.daycarealertTourMode'
-new_button = r'<button\n            className="unified-search-button tour-button"\n            onClick={() => window.toggleTourMode && window.toggleTourMode()}\n          >\n            {window.daycarealertTourMode'
+TOUR_BUTTON_RE = re.compile(rb'(<button[^>]*className="unified-search-button tour-button"[^>]*>)\s*\{window\.daycarealertTourMode')
+NEW_BUTTON = rb'<button\n            className="unified-search-button tour-button"\n            onClick={() => window.toggleTourMode && window.toggleTourMode()}\n          >\n            {window.daycarealertTourMode'
+
 
-content = re.sub(old_button, new_button, content)
+def transform(content):
+    return TOUR_BUTTON_RE.sub(NEW_BUTTON, content)
 
-with open('src/components/UnifiedSearch.js', 'w') as f:
-    f.write(content)
 
-print("✅ Button onClick added")
+if __name__ == '__main__':
+    buffer_output()
+    # The edit is ASCII-only, so it is made on the raw bytes without decoding
+    if apply_fix(TARGET, transform, cache_key='fix_tour_button', binary=True) is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("✅ Button onClick added")
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
+from patch_utils import apply_fix, buffer_output, splice_once
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
 # Find and replace - using raw strings
 old = '''  const handleDaycareSelect = useCallback((daycare, fromComparison = false) => {
@@ -24,9 +24,16 @@ new = '''  const handleDaycareSelect = useCallback((daycare, fromComparison = fa
     // If in compare mode and not coming from comparison modal, toggle selection
     if (compareMode && !fromComparison) {'''
 
-content = content.replace(old, new)
 
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
+def transform(content):
+    content = splice_once(content, old, new)
 
-print("✅ Fixed!")
+    return content
+
+
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='fix_tour_handler') is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("✅ Fixed!")
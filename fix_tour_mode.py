@@ -1,9 +1,47 @@
 #!/usr/bin/env python3
 import re
 
-# Read the file
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+from patch_utils import apply_fix, buffer_output
+
+TARGET = 'src/pages/OptimizedMySqlHome.js'
+
+# Blocks the edits below anchor on, matched literally
+COMPARISON_STATE = 'const [showComparisonModal, setShowComparisonModal] = useState(false);'
+OLD_USEEFFECT = '''  // Initialize window global variables for cross-component communication
+  useEffect(() => {
+    // Set window global variables
+    window.daycarealertCompareMode = compareMode;
+    window.daycareComparisonCount = daycareComparison.length;
+    window.toggleCompareMode = toggleCompareMode;
+    window.openComparisonModal = openComparisonModal;
+    
+    // Clean up global variables when component unmounts
+    return () => {
+      window.daycarealertCompareMode = undefined;
+      window.daycareComparisonCount = undefined;
+      window.toggleCompareMode = undefined;
+      window.openComparisonModal = undefined;
+    };
+  }, [compareMode, daycareComparison.length, toggleCompareMode, openComparisonModal]);'''
+OLD_HANDLER = '''  // Handle daycare selection from the data view
+  const handleDaycareSelect = useCallback((daycare, fromComparison = false) => {
+    // If in compare mode and not coming from comparison modal, toggle selection
+    if (compareMode && !fromComparison) {
+      // Toggle daycare in comparison - if already added, remove it
+      if (isInComparison(daycare)) {
+        removeFromComparison(daycare);
+      } else {
+        addToComparison(daycare);
+      }
+      return;
+    }'''
+OLD_DEPS = '[compareMode, initialTabView, isInComparison, addToComparison, removeFromComparison]'
+CONTAINER_DIV = "<div className={`daycare-data-container ${compareMode ? 'comparison-mode-active' : ''}`}>"
+
+# Anchors that need a real pattern
+REMOVE_FROM_COMPARISON = r'const removeFromComparison = useCallback\([^}]+\}\);[^}]+\}, \[daycareComparison\]\);'
+COMPARISON_BANNER = r'\{/\* Visual indicator for comparison mode \*/\}[^}]+\{compareMode[^}]+\}\)\s+\}'
+COMPARISON_INDICATOR = r'\{/\* Comparison Mode Indicator \*/\}[^}]+\{compareMode[^}]+\}\)\s+\}'
 
 # 1. Add tour state variables after comparison state variables
 tour_state = '''
@@ -13,13 +51,6 @@ tour_state = '''
   const [showTourModal, setShowTourModal] = useState(false);
   '''
 
-# Find the line with comparison state and add tour state after it
-content = re.sub(
-    r'(const \[showComparisonModal, setShowComparisonModal\] = useState\(false\);)',
-    r'\1' + tour_state,
-    content
-)
-
 # 2. Add tour functions after comparison functions
 tour_functions = '''
   // Tour mode functions
@@ -88,32 +119,7 @@ tour_functions = '''
   }, []);
 '''
 
-# Find the comparison functions and add tour functions after
-content = re.sub(
-    r'(const removeFromComparison = useCallback\([^}]+\}\);[^}]+\}, \[daycareComparison\]\);)',
-    r'\1' + tour_functions,
-    content,
-    flags=re.DOTALL
-)
-
 # 3. Update the useEffect that sets window globals to include tour variables
-old_useeffect = r'''  // Initialize window global variables for cross-component communication
-  useEffect\(\(\) => \{
-    // Set window global variables
-    window\.daycarealertCompareMode = compareMode;
-    window\.daycareComparisonCount = daycareComparison\.length;
-    window\.toggleCompareMode = toggleCompareMode;
-    window\.openComparisonModal = openComparisonModal;
-    
-    // Clean up global variables when component unmounts
-    return \(\) => \{
-      window\.daycarealertCompareMode = undefined;
-      window\.daycareComparisonCount = undefined;
-      window\.toggleCompareMode = undefined;
-      window\.openComparisonModal = undefined;
-    \};
-  \}, \[compareMode, daycareComparison\.length, toggleCompareMode, openComparisonModal\]\);'''
-
 new_useeffect = '''  // Initialize window global variables for cross-component communication
   useEffect(() => {
     // Set window global variables
@@ -141,22 +147,7 @@ new_useeffect = '''  // Initialize window global variables for cross-component c
     };
   }, [compareMode, daycareComparison.length, toggleCompareMode, openComparisonModal, tourMode, tourSelection.length, toggleTourMode, openTourModal]);'''
 
-content = re.sub(old_useeffect, new_useeffect, content)
-
 # 4. Fix the handleDaycareSelect function to add tour mode check
-old_handler = r'''  // Handle daycare selection from the data view
-  const handleDaycareSelect = useCallback\(\(daycare, fromComparison = false\) => \{
-    // If in compare mode and not coming from comparison modal, toggle selection
-    if \(compareMode && !fromComparison\) \{
-      // Toggle daycare in comparison - if already added, remove it
-      if \(isInComparison\(daycare\)\) \{
-        removeFromComparison\(daycare\);
-      \} else \{
-        addToComparison\(daycare\);
-      \}
-      return;
-    \}'''
-
 new_handler = '''  // Handle daycare selection from the data view
   const handleDaycareSelect = useCallback((daycare, fromComparison = false) => {
     // If in compare mode and not coming from comparison modal, toggle selection
@@ -188,21 +179,9 @@ new_handler = '''  // Handle daycare selection from the data view
       return;
     }'''
 
-content = re.sub(old_handler, new_handler, content)
-
 # 5. Update the dependency array of handleDaycareSelect
-old_deps = r'\[compareMode, initialTabView, isInComparison, addToComparison, removeFromComparison\]'
 new_deps = '[compareMode, initialTabView, isInComparison, addToComparison, removeFromComparison, tourMode, isInTourSelection, addToTourSelection, removeFromTourSelection, tourSelection.length]'
 
-content = re.sub(old_deps, new_deps, content)
-
-# 6. Update the main container div to include tour mode class
-content = re.sub(
-    r'<div className=\{`daycare-data-container \$\{compareMode \? \'comparison-mode-active\' : \'\'\}`\}>',
-    '<div className={`daycare-data-container ${compareMode ? \'comparison-mode-active\' : \'\'} ${tourMode ? \'tour-mode-active\' : \'\'}`}>',
-    content
-)
-
 # 7. Add tour mode banner after comparison mode banner
 tour_banner = '''
         
@@ -217,13 +196,6 @@ tour_banner = '''
           </div>
         )}'''
 
-content = re.sub(
-    r'(\{/\* Visual indicator for comparison mode \*/\}[^}]+\{compareMode[^}]+\}\)\s+\})',
-    r'\1' + tour_banner,
-    content,
-    flags=re.DOTALL
-)
-
 # 8. Add tour mode indicator after comparison mode indicator
 tour_indicator = '''
       
@@ -254,19 +226,42 @@ tour_indicator = '''
         </div>
       )}'''
 
-# Find the comparison mode indicator and add tour indicator after
-content = re.sub(
-    r'(\{/\* Comparison Mode Indicator \*/\}[^}]+\{compareMode[^}]+\}\)\s+\})',
-    r'\1' + tour_indicator,
-    content,
-    flags=re.DOTALL
+
+# 6. Update the main container div to include tour mode class
+new_container_div = '<div className={`daycare-data-container ${compareMode ? \'comparison-mode-active\' : \'\'} ${tourMode ? \'tour-mode-active\' : \'\'}`}>'
+
+# Each edit either follows its anchor with new code or swaps the anchor out, so
+# all of them are made in one sweep of a single alternation, dispatched on the
+# name of the branch that matched
+EDITS = {
+    # Add tour state after the comparison state
+    'comparison_state': (re.escape(COMPARISON_STATE), lambda m: m.group() + tour_state),
+    # Add tour functions after the comparison functions
+    'remove_from_comparison': (REMOVE_FROM_COMPARISON, lambda m: m.group() + tour_functions),
+    'old_useeffect': (re.escape(OLD_USEEFFECT), lambda m: new_useeffect),
+    'old_handler': (re.escape(OLD_HANDLER), lambda m: new_handler),
+    'old_deps': (re.escape(OLD_DEPS), lambda m: new_deps),
+    'container_div': (re.escape(CONTAINER_DIV), lambda m: new_container_div),
+    'comparison_banner': (COMPARISON_BANNER, lambda m: m.group() + tour_banner),
+    # Add tour indicator after the comparison mode indicator
+    'comparison_indicator': (COMPARISON_INDICATOR, lambda m: m.group() + tour_indicator),
+}
+EDITS_RE = re.compile(
+    '|'.join(f'(?P<{name}>{pattern})' for name, (pattern, _) in EDITS.items()),
+    re.DOTALL,
 )
 
-# Write the updated content
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
 
-print("✅ Tour mode functionality added successfully!")
-print("Next steps:")
-print("1. Restart your app: pm2 restart daycarealert-api-secondary")
-print("2. Check for any compilation errors in the logs")
+def transform(content):
+    return EDITS_RE.sub(lambda m: EDITS[m.lastgroup][1](m), content)
+
+
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='fix_tour_mode') is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("✅ Tour mode functionality added successfully!")
+        print("Next steps:")
+        print("1. Restart your app: pm2 restart daycarealert-api-secondary")
+        print("2. Check for any compilation errors in the logs")
@@ -1,75 +1,41 @@
 #!/usr/bin/env python3
+from patch_utils import apply_fix, buffer_output, load_template, match_bracket
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
-# Find and replace the onSubmit handler with correct format
-old_submit = '''        onSubmit={(formData) => {
-          console.log('Tour request submitted:', formData);
-          closeTourModal();
-          // Here you could add API call to submit tour request
-        }}'''
+MODAL_TAG = '<TourRequestModal'
+ON_SUBMIT = 'onSubmit={'
 
-new_submit = '''        onSubmit={async (formData) => {
-          try {
-            // Prepare the request payload in the format the API expects
-            const payload = {
-              parentInfo: {
-                parent_name: formData.parentName,
-                parent_email: formData.parentEmail,
-                parent_phone: formData.parentPhone,
-                parent_address: formData.parentAddress || '',
-                number_of_children: formData.numberOfChildren,
-                children_ages: JSON.stringify(formData.childrenAges),
-                preferred_start_date: formData.preferredStartDate,
-                available_days: JSON.stringify(formData.availableDays),
-                preferred_time_slots: formData.preferredTimeSlots.join(', '),
-                additional_notes: formData.additionalNotes || ''
-              },
-              selectedDaycares: tourSelection.map(d => ({
-                operation_id: d.operation_id,
-                operation_name: d.operation_name,
-                operation_type: d.operation_type,
-                location_address: d.location_address,
-                location_city: d.location_city,
-                location_state: d.location_state,
-                location_zip: d.location_zip
-              }))
-            };
+# Only the placeholder handler, which just logs the form, gets replaced
+PLACEHOLDER = "console.log('Tour request submitted:', formData);"
 
-            console.log('Submitting tour request:', payload);
+# The onSubmit handler in the format the API expects
+SUBMIT_HANDLER = 'tour_submit_handler.jsx.tmpl'
 
-            // Call the API
-            const response = await fetch('/api/tour-requests', {
-              method: 'POST',
-              headers: {
-                'Content-Type': 'application/json',
-              },
-              body: JSON.stringify(payload)
-            });
 
-            const data = await response.json();
+def transform(content):
+    # The handler is the onSubmit prop of the TourRequestModal element, closed by
+    # matching its braces, so it is found however the placeholder is formatted
+    tag = content.find(MODAL_TAG)
+    attr = content.find(ON_SUBMIT, tag) if tag != -1 else -1
+    # The prop has to belong to the modal, not to an element after it
+    if attr != -1 and content.find('<', tag + 1, attr) != -1:
+        attr = -1
+    end = match_bracket(content, attr + len(ON_SUBMIT) - 1) if attr != -1 else -1
 
-            if (response.ok && data.success) {
-              console.log('Tour request successful:', data);
-              alert(`✅ Success! Tour request #${data.tourRequestId} submitted!\\n\\nConfirmation emails have been sent to:\\n- ${formData.parentEmail}\\n- Selected daycare centers\\n\\nThey will contact you to schedule tours.`);
-              
-              // Clear the selection and close modal
-              setTourSelection([]);
-              setTourMode(false);
-              closeTourModal();
-            } else {
-              throw new Error(data.message || 'Failed to submit tour request');
-            }
-          } catch (error) {
-            console.error('Error submitting tour request:', error);
-            alert('❌ Failed to submit tour request. Please try again or contact support.');
-          }
-        }}'''
+    if end == -1:
+        print("❌ Could not find the TourRequestModal onSubmit handler")
+    elif PLACEHOLDER in content[attr:end]:
+        # Find and replace the onSubmit handler with correct format
+        new_submit = load_template(SUBMIT_HANDLER)
+        content = content[:attr] + new_submit.lstrip(' ') + content[end + 1:]
 
-content = content.replace(old_submit, new_submit)
+    return content
 
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
 
-print("✅ API payload format fixed!")
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='fix_tour_payload') is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("✅ API payload format fixed!")
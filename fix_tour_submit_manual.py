@@ -1,22 +1,38 @@
 #!/usr/bin/env python3
 import re
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+from patch_utils import match_bracket, read_source
 
-# Find the TourRequestModal component
-pattern = r'<TourRequestModal\s+isOpen=\{showTourModal\}.*?onSubmit=\{async \(formData\) => \{.*?\}\s*\}'
+MODAL_TAG = '<TourRequestModal'
+ASYNC_SUBMIT = 'onSubmit={async (formData) => {'
+
+# Matched only right after the tag, so the engine never scans ahead
+IS_OPEN_RE = re.compile(r'\s+isOpen=\{showTourModal\}')
+
+content = read_source('src/pages/OptimizedMySqlHome.js')
+
+# Find the TourRequestModal component: the tag, its isOpen prop, then an async
+# onSubmit prop on the same element whose handler closes. Every step is a find
+# or a brace match moving forward, with no lazy DOTALL pattern to backtrack over
+start = -1
+tag = content.find(MODAL_TAG)
+while tag != -1 and start == -1:
+    is_open = IS_OPEN_RE.match(content, tag + len(MODAL_TAG))
+    attr = content.find(ASYNC_SUBMIT, is_open.end()) if is_open else -1
+    if attr != -1 and content.find('<', tag + 1, attr) == -1:
+        if match_bracket(content, attr + len('onSubmit=')) != -1:
+            start = tag
+    tag = content.find(MODAL_TAG, tag + 1)
 
 # Check if we can find it
-match = re.search(pattern, content, re.DOTALL)
-if match:
+if start != -1:
     print("Found TourRequestModal")
-    print("Match starts at:", match.start())
-    print("First 100 chars:", match.group(0)[:100])
+    print("Match starts at:", start)
+    print("First 100 chars:", content[start:start + 100])
 else:
     print("Could not find TourRequestModal with onSubmit")
     # Try alternative search
-    if 'onSubmit={async (formData)' in content:
-        pos = content.find('onSubmit={async (formData)')
+    pos = content.find('onSubmit={async (formData)')
+    if pos != -1:
         print(f"Found onSubmit at position {pos}")
         print("Context:", content[pos:pos+200])
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
+from patch_utils import apply_fix, buffer_output, file_contains
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
 # Fix the toggle logic - need to check the NEW value, not old
 old_toggle = '''  const toggleTourMode = useCallback(() => {
@@ -34,9 +34,22 @@ new_toggle = '''  const toggleTourMode = useCallback(() => {
     });
   }, []);'''
 
-content = content.replace(old_toggle, new_toggle)
 
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
+def transform(content):
+    content = content.replace(old_toggle, new_toggle)
 
-print("✅ Fixed toggle logic!")
+    return content
+
+
+if __name__ == '__main__':
+    buffer_output()
+    # Probe the mapped file first, so one without the old toggle is never read
+    if file_contains(TARGET, old_toggle):
+        if apply_fix(TARGET, transform, cache_key='fix_tour_toggle_logic') is not None:
+            print("✅ Fixed toggle logic!")
+        else:
+            print(f"✅ {TARGET} already up to date")
+    elif file_contains(TARGET, new_toggle):
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print(f"⚠️ Old toggleTourMode block not found in {TARGET} - left as it is")
@@ -1,40 +1,46 @@
 #!/usr/bin/env python3
 import re
 
-# Read the file
-with open('src/components/UnifiedSearch.js', 'r') as f:
-    content = f.read()
-
-# Find the tour button and ensure it's properly connected
-# Look for the tour button section
-tour_button_pattern = r'(<button[^>]*className="unified-search-button tour-button"[^>]*>)'
-
-# Replace it with proper onClick handler
-if 'SELECT DAYCARES FOR TOURS' in content:
-    # Check if onClick is already there
-    if 'onClick={() => window.toggleTourMode && window.toggleTourMode()}' not in content:
-        print("Adding onClick handler to tour button...")
-        
-        # Add onClick to the tour button
-        content = re.sub(
-            r'(<button[^>]*className="unified-search-button tour-button")',
-            r'\1 onClick={() => window.toggleTourMode && window.toggleTourMode()}',
-            content
-        )
-        
-        # Update button text to be dynamic
-        content = re.sub(
-            r'(SELECT DAYCARES FOR TOURS)',
-            r'{window.daycarealertTourMode ? "EXIT TOUR MODE" : "SELECT DAYCARES FOR TOURS"}',
-            content
-        )
+from patch_utils import apply_fix, buffer_output
+
+TARGET = 'src/components/UnifiedSearch.js'
+
+# The tour button's opening tag, up to its className
+TOUR_BUTTON_RE = re.compile(rb'(<button[^>]*className="unified-search-button tour-button")')
+TOUR_TEXT_RE = re.compile(rb'(SELECT DAYCARES FOR TOURS)')
+
+
+def transform(content):
+    # Find the tour button and ensure it's properly connected
+    # Replace it with proper onClick handler
+    if b'SELECT DAYCARES FOR TOURS' in content:
+        # Check if onClick is already there
+        if b'onClick={() => window.toggleTourMode && window.toggleTourMode()}' not in content:
+            print("Adding onClick handler to tour button...")
+
+            # Add onClick to the tour button
+            content = TOUR_BUTTON_RE.sub(
+                rb'\1 onClick={() => window.toggleTourMode && window.toggleTourMode()}',
+                content
+            )
+
+            # Update button text to be dynamic
+            content = TOUR_TEXT_RE.sub(
+                rb'{window.daycarealertTourMode ? "EXIT TOUR MODE" : "SELECT DAYCARES FOR TOURS"}',
+                content
+            )
+        else:
+            print("Tour button already has onClick handler")
     else:
-        print("Tour button already has onClick handler")
-else:
-    print("Tour button not found in UnifiedSearch.js")
+        print("Tour button not found in UnifiedSearch.js")
 
-# Write back
-with open('src/components/UnifiedSearch.js', 'w') as f:
-    f.write(content)
+    return content
 
-print("✅ UnifiedSearch.js updated")
+
+if __name__ == '__main__':
+    buffer_output()
+    # Every edit is ASCII-only, so the file stays undecoded bytes
+    if apply_fix(TARGET, transform, cache_key='fix_unified_search', binary=True) is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("✅ UnifiedSearch.js updated")
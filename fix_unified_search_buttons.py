@@ -1,43 +1,66 @@
 #!/usr/bin/env python3
+from patch_utils import apply_fix, buffer_output, file_contains, replace_anchors
 
-with open('src/components/UnifiedSearch.js', 'r') as f:
-    content = f.read()
+TARGET = 'src/components/UnifiedSearch.js'
 
 # Fix comparison toggle button - remove tour toggle call
-content = content.replace(
-    '''              onClick={() => {
+OLD_COMPARE_TOGGLE = b'''              onClick={() => {
               if (window.toggleTourMode) {
                 window.toggleTourMode();
               }
                 if (window.toggleCompareMode) {
                   window.toggleCompareMode();
                 }
-              }}''',
-    '''              onClick={() => {
+              }}'''
+NEW_COMPARE_TOGGLE = b'''              onClick={() => {
                 if (window.toggleCompareMode) {
                   window.toggleCompareMode();
                 }
               }}'''
-)
 
 # Fix view comparison button - remove tour toggle call
-content = content.replace(
-    '''                  onClick={() => {
+OLD_VIEW_COMPARISON = b'''                  onClick={() => {
               if (window.toggleTourMode) {
                 window.toggleTourMode();
               }
                     if (window.openComparisonModal) {
                       window.openComparisonModal();
                     }
-                  }}''',
-    '''                  onClick={() => {
+                  }}'''
+NEW_VIEW_COMPARISON = b'''                  onClick={() => {
                     if (window.openComparisonModal) {
                       window.openComparisonModal();
                     }
                   }}'''
-)
 
-with open('src/components/UnifiedSearch.js', 'w') as f:
-    f.write(content)
+EDITS = {
+    'comparison toggle': (OLD_COMPARE_TOGGLE, NEW_COMPARE_TOGGLE),
+    'view comparison': (OLD_VIEW_COMPARISON, NEW_VIEW_COMPARISON),
+}
+
+
+def transform(content):
+    # The two handlers sit at separate places in the file, in either order, so
+    # they are put in file order first and the file is rebuilt once around them
+    names = sorted(EDITS, key=lambda name: content.find(EDITS[name][0]))
+    content, found = replace_anchors(content, [EDITS[name] for name in names])
+    for name, applied in zip(names, found):
+        if not applied:
+            print(f"⚠️ Old {name} handler not found - left as it is")
+    return content
+
 
-print("✅ Fixed button handlers!")
+if __name__ == '__main__':
+    buffer_output()
+    # Probe the mapped file first; when neither old handler is there it is never
+    # read or rewritten. Both edits are ASCII-only, so they are made on the raw
+    # bytes without decoding
+    if any(file_contains(TARGET, old) for old, _ in EDITS.values()):
+        if apply_fix(TARGET, transform, cache_key='fix_unified_search_buttons', binary=True) is not None:
+            print("✅ Fixed button handlers!")
+        else:
+            print(f"✅ {TARGET} already up to date")
+    elif all(file_contains(TARGET, new) for _, new in EDITS.values()):
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print(f"⚠️ Old button handlers not found in {TARGET} - left as they are")
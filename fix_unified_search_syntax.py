@@ -1,24 +1,30 @@
 #!/usr/bin/env python3
 import re
 
-with open('src/components/UnifiedSearch.js', 'r') as f:
-    content = f.read()
+from patch_utils import apply_fix, buffer_output
 
-# Find and fix the malformed line
-old_line = r'\{window\.daycarealertTourMode \? "EXIT TOUR MODE" : "\{window\.daycarealertTourMode \? "EXIT TOUR MODE" : "SELECT DAYCARES FOR TOURS"\}"\}'
-new_line = '{window.daycarealertTourMode ? "EXIT TOUR MODE" : "SELECT DAYCARES FOR TOURS"}'
+TARGET = 'src/components/UnifiedSearch.js'
 
-content = re.sub(old_line, new_line, content)
+# The button text after the dynamic label was nested inside itself
+NESTED_LABEL_RE = re.compile(rb'\{window\.daycarealertTourMode \? "EXIT TOUR MODE" : "\{window\.daycarealertTourMode \? "EXIT TOUR MODE" : "SELECT DAYCARES FOR TOURS"\}"\}')
+# Any other malformed label ending in a stray quote and brace
+MALFORMED_LABEL_RE = re.compile(rb'\{window\.daycarealertTourMode.*?DAYCARES FOR TOURS.*?\}"\}', re.DOTALL)
 
-# Also fix if it appears in a different format
-content = re.sub(
-    r'\{window\.daycarealertTourMode.*?DAYCARES FOR TOURS.*?\}"\}',
-    new_line,
-    content,
-    flags=re.DOTALL
-)
+new_line = b'{window.daycarealertTourMode ? "EXIT TOUR MODE" : "SELECT DAYCARES FOR TOURS"}'
 
-with open('src/components/UnifiedSearch.js', 'w') as f:
-    f.write(content)
 
-print("✅ UnifiedSearch.js syntax fixed!")
+def transform(content):
+    # Find and fix the malformed line
+    content = NESTED_LABEL_RE.sub(new_line, content)
+
+    # Also fix if it appears in a different format
+    return MALFORMED_LABEL_RE.sub(new_line, content)
+
+
+if __name__ == '__main__':
+    buffer_output()
+    # The label is ASCII, so the fix is made on the raw bytes without decoding
+    if apply_fix(TARGET, transform, cache_key='fix_unified_search_syntax', binary=True) is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("✅ UnifiedSearch.js syntax fixed!")
@@ -1,44 +1,79 @@
 #!/usr/bin/env python3
 import re
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
-
-print("Moving useEffect to correct position...")
-
-# Find and extract the useEffect block
-useeffect_pattern = r'  // Initialize window global variables for cross-component communication\s+useEffect\(\(\) => \{[^}]*\{[^}]*\}[^}]*\}, \[compareMode, daycareComparison\.length, toggleCompareMode, openComparisonModal, tourMode, tourSelection\.length, toggleTourMode, openTourModal\]\);'
-
-useeffect_match = re.search(useeffect_pattern, content, re.DOTALL)
-
-if useeffect_match:
-    print("Found useEffect")
-    useeffect_block = useeffect_match.group(0)
-    
-    # Remove it from current location
-    content = content[:useeffect_match.start()] + content[useeffect_match.end():]
-    
-    # Find closeTourModal (the last tour function)
-    close_pattern = r'  const closeTourModal = useCallback\(\(\) => \{\s+setShowTourModal\(false\);\s+\}, \[\]\);'
-    close_match = re.search(close_pattern, content)
-    
-    if close_match:
-        print("Found closeTourModal at position", close_match.start())
-        # Insert useEffect right after it
-        insert_pos = close_match.end()
-        content = content[:insert_pos] + '\n\n' + useeffect_block + content[insert_pos:]
-        print("✅ useEffect moved after closeTourModal")
+from patch_utils import apply_fix, buffer_output, match_bracket
+
+TARGET = 'src/pages/OptimizedMySqlHome.js'
+
+# The window globals useEffect, once it already lists the tour dependencies. Its
+# body is closed by matching braces, since a pattern cannot balance them
+USEEFFECT_COMMENT = '  // Initialize window global variables for cross-component communication'
+USEEFFECT_OPEN = 'useEffect(() => {'
+TOUR_DEPS = ', [compareMode, daycareComparison.length, toggleCompareMode, openComparisonModal, tourMode, tourSelection.length, toggleTourMode, openTourModal]);'
+
+WHITESPACE_RE = re.compile(r'\s+')
+CLOSE_TOUR_MODAL_RE = re.compile(r'  const closeTourModal = useCallback\(\(\) => \{\s+setShowTourModal\(false\);\s+\}, \[\]\);')
+# Fallback anchor: the end of a tour function just before the URL parameters block
+ALT_ANCHOR_RE = re.compile(r'(\}, \[tourSelection\]\);)(\s+)(  // Get URL parameters)')
+
+
+def find_useeffect(content):
+    """Return the (start, end) span of the window globals useEffect, or None."""
+    start = content.find(USEEFFECT_COMMENT)
+    while start != -1:
+        gap = WHITESPACE_RE.match(content, start + len(USEEFFECT_COMMENT))
+        if gap and content.startswith(USEEFFECT_OPEN, gap.end()):
+            close = match_bracket(content, gap.end() + len(USEEFFECT_OPEN) - 1)
+            if close != -1 and content.startswith(TOUR_DEPS, close + 1):
+                return start, close + 1 + len(TOUR_DEPS)
+        start = content.find(USEEFFECT_COMMENT, start + 1)
+    return None
+
+
+def transform(content):
+    print("Moving useEffect to correct position...")
+
+    # Find and extract the useEffect block
+    span = find_useeffect(content)
+
+    if span:
+        print("Found useEffect")
+        start, end = span
+        useeffect_block = content[start:end]
+
+        # Find closeTourModal (the last tour function) on either side of the
+        # block, so the file is only rebuilt once, around both
+        close_match = CLOSE_TOUR_MODAL_RE.search(content, 0, start) or CLOSE_TOUR_MODAL_RE.search(content, end)
+
+        if close_match:
+            insert_pos = close_match.end()
+            # Report the position as it is once the block has been taken out
+            shift = end - start if insert_pos > end else 0
+            print("Found closeTourModal at position", close_match.start() - shift)
+            # Insert useEffect right after it
+            moved = '\n\n' + useeffect_block
+            if insert_pos > end:
+                content = content[:start] + content[end:insert_pos] + moved + content[insert_pos:]
+            else:
+                content = content[:insert_pos] + moved + content[insert_pos:start] + content[end:]
+            print("✅ useEffect moved after closeTourModal")
+        else:
+            print("Could not find closeTourModal exactly, searching for alternative...")
+            # Remove it from current location
+            content = content[:start] + content[end:]
+            # Try to find any }, []); that's part of tour functions
+            if ALT_ANCHOR_RE.search(content):
+                content = ALT_ANCHOR_RE.sub(r'\1\n\n' + useeffect_block + r'\n\2\3', content)
+                print("✅ useEffect inserted (alternative position)")
+    else:
+        print("ERROR: Could not find useEffect!")
+
+    return content
+
+
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='fix_useeffect_position') is None:
+        print(f"✅ {TARGET} already up to date")
     else:
-        print("Could not find closeTourModal exactly, searching for alternative...")
-        # Try to find any }, []); that's part of tour functions
-        alt_pattern = r'(\}, \[tourSelection\]\);)(\s+)(  // Get URL parameters)'
-        if re.search(alt_pattern, content):
-            content = re.sub(alt_pattern, r'\1\n\n' + useeffect_block + r'\n\2\3', content)
-            print("✅ useEffect inserted (alternative position)")
-else:
-    print("ERROR: Could not find useEffect!")
-
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
-
-print("Done!")
+        print("Done!")
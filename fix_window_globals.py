@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 import re
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+from patch_utils import apply_fix, buffer_output
+
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
 # Find the useEffect that sets window globals
-old_useeffect = r'''  // Initialize window global variables for cross-component communication
+OLD_USEEFFECT_RE = re.compile(r'''  // Initialize window global variables for cross-component communication
   useEffect\(\(\) => \{
     // Set window global variables
     window\.daycarealertCompareMode = compareMode;
@@ -20,7 +21,7 @@ old_useeffect = r'''  // Initialize window global variables for cross-component
       window\.toggleCompareMode = undefined;
       window\.openComparisonModal = undefined;
     \};
-  \}, \[compareMode, daycareComparison\.length, toggleCompareMode, openComparisonModal\]\);'''
+  \}, \[compareMode, daycareComparison\.length, toggleCompareMode, openComparisonModal\]\);''')
 
 new_useeffect = '''  // Initialize window global variables for cross-component communication
   useEffect(() => {
@@ -49,17 +50,24 @@ new_useeffect = '''  // Initialize window global variables for cross-component c
     };
   }, [compareMode, daycareComparison.length, toggleCompareMode, openComparisonModal, tourMode, tourSelection.length, toggleTourMode, openTourModal]);'''
 
-if re.search(old_useeffect, content):
-    content = re.sub(old_useeffect, new_useeffect, content)
-    print("✅ Updated useEffect with tour globals")
-else:
-    print("⚠️ Could not find the exact useEffect pattern - checking if tour globals already exist")
-    if 'window.toggleTourMode = toggleTourMode' in content:
-        print("✅ Tour globals already in useEffect")
+
+def transform(content):
+    if OLD_USEEFFECT_RE.search(content):
+        content = OLD_USEEFFECT_RE.sub(new_useeffect, content)
+        print("✅ Updated useEffect with tour globals")
     else:
-        print("❌ Need to manually add tour globals to useEffect")
+        print("⚠️ Could not find the exact useEffect pattern - checking if tour globals already exist")
+        if 'window.toggleTourMode = toggleTourMode' in content:
+            print("✅ Tour globals already in useEffect")
+        else:
+            print("❌ Need to manually add tour globals to useEffect")
 
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
+    return content
 
-print("Done!")
+
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='fix_window_globals') is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("Done!")
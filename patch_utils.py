@@ -0,0 +1,381 @@
+"""Shared helpers for the one-off source patch scripts in this directory."""
+import contextlib
+import functools
+import hashlib
+import io
+import json
+import mmap
+import os
+import re
+import shutil
+import sys
+
+# Large enough to move a whole JS source file in one read/write call
+BUFFER_SIZE = 1 << 20
+
+# Sidecar recording the hash each fix left the file in, so reruns can bail early
+CACHE_PATH = '.tour_fix_cache.json'
+
+# JS fragments too large to keep inline live here as <name>.jsx.tmpl files
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+# Only the bracket characters themselves are visited when balancing a block
+_BRACKET_RES = {pair: re.compile('[%s]' % re.escape(pair)) for pair in ('{}', '()', '[]')}
+
+
+def buffer_output():
+    """Stop stdout flushing on every newline.
+
+    The progress messages then leave in one write, when the interpreter flushes
+    stdout on exit, instead of one write per print().
+    """
+    sys.stdout.reconfigure(line_buffering=False)
+
+
+def read_source(path):
+    """Read path in binary through a large buffer and decode it once."""
+    with open(path, 'rb', buffering=BUFFER_SIZE) as f:
+        return f.read().decode('utf-8')
+
+
+def read_bytes(path):
+    """Read path in binary through a large buffer, leaving it undecoded."""
+    with open(path, 'rb', buffering=BUFFER_SIZE) as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=None)
+def load_template(name):
+    """Return the fragment in TEMPLATE_DIR/name, read once per process.
+
+    Template files end in a newline for the sake of editors; it is not part
+    of the fragment and is dropped.
+    """
+    text = read_source(os.path.join(TEMPLATE_DIR, name))
+    return text[:-1] if text.endswith('\n') else text
+
+
+def split_lines(content):
+    """Split content into lines, newlines kept, exactly as readlines() would."""
+    return io.StringIO(content).readlines()
+
+
+def count_lines(content):
+    """Return how many lines split_lines(content) would produce, without splitting."""
+    return content.count('\n') + (not content.endswith('\n') and content != '')
+
+
+def line_offset(content, count, start=0):
+    """Return the offset count lines past start, or len(content) if it runs out.
+
+    Hops from newline to newline with str.find, so a fixed line range can be
+    sliced out of content without building a list of every line.
+    """
+    pos = start
+    for _ in range(count):
+        pos = content.find('\n', pos) + 1
+        if not pos:
+            return len(content)
+    return pos
+
+
+def read_lines(path):
+    """Return the lines of path, newlines kept."""
+    return split_lines(read_source(path))
+
+
+@contextlib.contextmanager
+def map_bytes(path):
+    """Yield a read-only memory map of path, or b'' when path is empty.
+
+    mmap refuses to map an empty file, so that case gets an empty bytes
+    object, which is falsy and searches like an empty map would.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def file_contains(path, literal):
+    """True when literal, str or bytes, occurs in path.
+
+    The raw bytes are searched through a read-only memory map, so a file that
+    already has the marker is never read into Python or decoded.
+    """
+    if isinstance(literal, str):
+        literal = literal.encode('utf-8')
+    with map_bytes(path) as mm:
+        return mm.find(literal) != -1
+
+
+def atomic_write(path, data):
+    """Write data to path through a sibling temp file swapped in with os.replace.
+
+    A run that dies mid-write leaves the temp file behind instead of a
+    half-written source file.
+    """
+    tmp = path + '.tmp'
+    with open(tmp, 'wb', buffering=BUFFER_SIZE) as f:
+        f.write(data)
+    if os.path.exists(path):
+        shutil.copymode(path, tmp)
+    os.replace(tmp, path)
+
+
+def write_source(path, content):
+    """Encode content once and write it atomically through a large buffer."""
+    atomic_write(path, content.encode('utf-8'))
+
+
+def show_lines(lines, start, prefix='Line '):
+    """Echo lines as 'Line N: ...', numbering lines[0] as line start + 1.
+
+    Each line is echoed with the newline it already ends in, so nothing is
+    stripped or re-terminated per line.
+    """
+    sys.stdout.writelines(f"{prefix}{number}: {line}" for number, line in enumerate(lines, start=start + 1))
+    if lines and not lines[-1].endswith('\n'):
+        sys.stdout.write('\n')
+
+
+def content_hash(content):
+    """Hex SHA-256 of content, which may be str or bytes."""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return hashlib.sha256(content).hexdigest()
+
+
+def _load_cache():
+    if not os.path.exists(CACHE_PATH):
+        return {}
+    with open(CACHE_PATH, 'r') as f:
+        return json.load(f)
+
+
+def already_applied(name, content):
+    """True when content is exactly what fix name produced on its last run."""
+    return _load_cache().get(name) == content_hash(content)
+
+
+def record_applied(name, content):
+    cache = _load_cache()
+    cache[name] = content_hash(content)
+    with open(CACHE_PATH, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+def apply_fix(path, transform, cache_key=None, binary=False):
+    """Run a transform(content) -> content fix against path, writing only on change.
+
+    With a cache_key the fix is skipped, returning None, when the file still
+    hashes to what that fix last produced. The hash is taken over the raw
+    bytes, so a skipped run never decodes the file. A run that changed
+    nothing, say because an anchor was missing, is not recorded, so it is
+    tried again next time. With binary the transform is handed those raw
+    bytes and returns bytes, for fixes whose edits are ASCII-only.
+    """
+    raw = read_bytes(path)
+    if cache_key is not None and already_applied(cache_key, raw):
+        return None
+
+    content = raw if binary else raw.decode('utf-8')
+    new_content = transform(content)
+    if new_content != content:
+        atomic_write(path, new_content if binary else new_content.encode('utf-8'))
+        if cache_key is not None:
+            record_applied(cache_key, new_content)
+    return new_content
+
+
+def run_pipeline(path, steps, cache_key=None):
+    """Pipe the contents of path through transform steps with one read and one write.
+
+    Nothing reaches disk when the steps left a bracket pair further from
+    balanced, by count, than the file started. That only catches a net
+    imbalance: an edit that removes or misplaces balanced text, such as a
+    step patching by line number, gets through, so such steps must not rely
+    on it.
+
+    With a cache_key no step runs when the file still hashes to what the
+    pipeline last left it as; a run that changed nothing is not recorded.
+    """
+    original = read_source(path)
+    if cache_key is not None and already_applied(cache_key, original):
+        print(f"\n✅ {path} already up to date")
+        return
+
+    content = original
+    for step in steps:
+        content = step(content)
+
+    before = bracket_balance(original)
+    after = bracket_balance(content)
+    if any(abs(after[pair]) > abs(before[pair]) for pair in before):
+        print(f"\n❌ Fixes left unbalanced brackets in {path} - not writing")
+        print(f"Before: {before}")
+        print(f"After:  {after}")
+        sys.exit(1)
+
+    if content != original:
+        write_source(path, content)
+        print(f"\n✅ Applied {len(steps)} fixes to {path}")
+        if cache_key is not None:
+            record_applied(cache_key, content)
+    else:
+        print(f"\n✅ {path} already up to date")
+
+
+def select_steps(steps, names):
+    """Return the steps whose fix module is named in names, in pipeline order.
+
+    Names may be given with or without the .py suffix, so a driver can be
+    pointed at the same script names that run standalone.
+    """
+    wanted = {name[:-3] if name.endswith('.py') else name for name in names}
+    unknown = wanted - {step.__module__ for step in steps}
+    if unknown:
+        print(f"❌ Unknown fixes: {', '.join(sorted(unknown))}")
+        sys.exit(1)
+    return [step for step in steps if step.__module__ in wanted]
+
+
+def splice_once(content, old, new):
+    """Replace the first occurrence of old with new, scanning only up to it.
+
+    Returns content unchanged (the same object) when old is absent.
+    """
+    i = content.find(old)
+    if i == -1:
+        return content
+    return content[:i] + new + content[i + len(old):]
+
+
+def replace_anchors(content, edits):
+    """Replace anchors with their replacements in one left-to-right pass.
+
+    edits is a sequence of (anchor, replacement) in the order the anchors appear
+    in content. Each anchor is searched for only past the previous edit, and
+    one that is not found is skipped. The text between anchors is sliced out
+    and joined once, so several edits never copy the whole of content more
+    than once. Works on str and bytes alike.
+
+    Returns (new_content, found), found holding one bool per edit.
+    """
+    pieces = []
+    found = []
+    cursor = 0
+    for anchor, replacement in edits:
+        pos = content.find(anchor, cursor)
+        found.append(pos != -1)
+        if pos != -1:
+            pieces += (content[cursor:pos], replacement)
+            cursor = pos + len(anchor)
+    pieces.append(content[cursor:])
+    return content[:0].join(pieces), found
+
+
+def drop_spans(content, spans):
+    """Return content without the (start, end) spans, which must be sorted and disjoint.
+
+    Only the text kept between spans is sliced out, and it is joined once.
+    """
+    pieces = []
+    pos = 0
+    for start, end in spans:
+        pieces.append(content[pos:start])
+        pos = end
+    pieces.append(content[pos:])
+    return content[:0].join(pieces)
+
+
+def replace_literals(content, edits):
+    """Apply literal (old, new) edits to content in a single scan.
+
+    Every old literal is located in one pass, so batching several edits does
+    not rescan the content once per edit. Returns (new_content, count).
+    """
+    replacements = dict(edits)
+    # Longest literal first so a shorter edit never shadows one that extends it
+    pattern = re.compile('|'.join(
+        re.escape(old) for old in sorted(replacements, key=len, reverse=True)
+    ))
+    return pattern.subn(lambda m: replacements[m.group(0)], content)
+
+
+def rewrite_file(path, edits, skip_if=None):
+    """Apply literal (old, new) edits to path with one read, one scan and one write.
+
+    Returns the number of replacements made; the file is only written when
+    something changed. When skip_if is already in the file it is not read at all.
+    """
+    if skip_if is not None and file_contains(path, skip_if):
+        return 0
+
+    content = read_source(path)
+    content, count = replace_literals(content, edits)
+    if count:
+        write_source(path, content)
+
+    return count
+
+
+def find_markers(content, literals):
+    """Locate the first occurrence of every literal in a single pass over content.
+
+    Returns a dict mapping each literal to its offset, or -1 when absent. The
+    lookahead lets literals that overlap each other still be found.
+    """
+    positions = dict.fromkeys(literals, -1)
+    pattern = re.compile('(?=%s)' % '|'.join(re.escape(literal) for literal in positions))
+    pending = list(positions)
+    for match in pattern.finditer(content):
+        start = match.start()
+        # Several literals may begin at the same offset; settle all of them here
+        for literal in [literal for literal in pending if content.startswith(literal, start)]:
+            positions[literal] = start
+            pending.remove(literal)
+        if not pending:
+            break
+    return positions
+
+
+def match_bracket(content, start, pair='{}'):
+    """Return the index of the bracket closing the one opened at start, or -1.
+
+    The scan jumps from bracket to bracket through a compiled pattern, so the
+    text in between is skipped in C rather than walked character by character.
+    """
+    opening = pair[0]
+    depth = 0
+    for match in _BRACKET_RES[pair].finditer(content, start):
+        if match.group() == opening:
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return match.start()
+    return -1
+
+
+def bracket_balance(content):
+    """Return opening minus closing count for each bracket pair in content."""
+    return {pair: content.count(pair[0]) - content.count(pair[1]) for pair in _BRACKET_RES}
+
+
+def bracket_index(content, pair='{}'):
+    """Map the offset of every opening bracket in content to its closing bracket.
+
+    Built in one pass, after which closing any block is a dict lookup.
+    """
+    opening = pair[0]
+    index = {}
+    stack = []
+    for match in _BRACKET_RES[pair].finditer(content):
+        if match.group() == opening:
+            stack.append(match.start())
+        elif stack:
+            index[stack.pop()] = match.start()
+    return index
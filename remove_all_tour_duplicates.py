@@ -1,61 +1,71 @@
 #!/usr/bin/env python3
+import re
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    lines = f.readlines()
-
-print(f"Total lines: {len(lines)}")
-
-# Find all lines with tour state declarations
-tour_mode_lines = []
-tour_selection_lines = []
-show_modal_lines = []
-
-for i, line in enumerate(lines):
-    if 'const [tourMode, setTourMode] = useState(false)' in line:
-        tour_mode_lines.append(i)
-        print(f"Found tourMode at line {i+1}: {line.strip()}")
-    if 'const [tourSelection, setTourSelection] = useState([])' in line:
-        tour_selection_lines.append(i)
-        print(f"Found tourSelection at line {i+1}: {line.strip()}")
-    if 'const [showTourModal, setShowTourModal] = useState(false)' in line:
-        show_modal_lines.append(i)
-        print(f"Found showTourModal at line {i+1}: {line.strip()}")
-
-# Keep only the first occurrence of each (around line 27-29)
-# Remove all others
-lines_to_remove = set()
-
-if len(tour_mode_lines) > 1:
-    print(f"\nRemoving {len(tour_mode_lines)-1} duplicate tourMode declarations")
-    for line_num in tour_mode_lines[1:]:
-        lines_to_remove.add(line_num)
-
-if len(tour_selection_lines) > 1:
-    print(f"Removing {len(tour_selection_lines)-1} duplicate tourSelection declarations")
-    for line_num in tour_selection_lines[1:]:
-        lines_to_remove.add(line_num)
-
-if len(show_modal_lines) > 1:
-    print(f"Removing {len(show_modal_lines)-1} duplicate showTourModal declarations")
-    for line_num in show_modal_lines[1:]:
-        lines_to_remove.add(line_num)
-
-# Remove comment lines that might be above duplicates
-for line_num in list(lines_to_remove):
-    if line_num > 0 and '// State for tour selection' in lines[line_num - 1]:
-        lines_to_remove.add(line_num - 1)
-    if line_num > 0 and '// eslint-disable-next-line' in lines[line_num - 1]:
-        lines_to_remove.add(line_num - 1)
-
-# Create new content without duplicates
-new_lines = []
-for i, line in enumerate(lines):
-    if i not in lines_to_remove:
-        new_lines.append(line)
-    else:
-        print(f"Removing line {i+1}: {line.strip()}")
-
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.writelines(new_lines)
-
-print(f"\n✅ Duplicates removed! Original: {len(lines)} lines, New: {len(new_lines)} lines")
+from patch_utils import apply_fix, buffer_output, count_lines, drop_spans
+
+TARGET = 'src/pages/OptimizedMySqlHome.js'
+
+# The tour state declarations that must only appear once
+DECLARATIONS = {
+    'tourMode': 'const [tourMode, setTourMode] = useState(false)',
+    'tourSelection': 'const [tourSelection, setTourSelection] = useState([])',
+    'showTourModal': 'const [showTourModal, setShowTourModal] = useState(false)',
+}
+
+# A whole line holding any of them, the matching group named after its state
+DECLARATION_RE = re.compile(
+    r'^.*?(?:%s).*\n?' % '|'.join(
+        f'(?P<{name}>{re.escape(declaration)})' for name, declaration in DECLARATIONS.items()
+    ),
+    re.MULTILINE,
+)
+
+# Comments that go with a duplicate when they sit on the line above it
+LEADING_COMMENTS = ('// State for tour selection', '// eslint-disable-next-line')
+
+
+def transform(content):
+    print(f"Total lines: {count_lines(content)}")
+
+    # Find all lines with tour state declarations in one scan, keeping each
+    # one's line number and span rather than splitting the file into lines
+    found = {name: [] for name in DECLARATIONS}
+    line_number = 0
+    pos = 0
+    for match in DECLARATION_RE.finditer(content):
+        line_number += content.count('\n', pos, match.start())
+        pos = match.start()
+        found[match.lastgroup].append((line_number, match.start(), match.end()))
+        print(f"Found {match.lastgroup} at line {line_number + 1}: {match.group().strip()}")
+
+    # Keep only the first occurrence of each (around line 27-29)
+    # Remove all others
+    to_remove = {}
+    if any(len(spans) > 1 for spans in found.values()):
+        print()
+    for name, spans in found.items():
+        if len(spans) > 1:
+            print(f"Removing {len(spans)-1} duplicate {name} declarations")
+            for line_number, start, end in spans[1:]:
+                to_remove[line_number] = (start, end)
+
+    # Remove comment lines that might be above duplicates
+    for line_number, (start, end) in list(to_remove.items()):
+        if line_number > 0:
+            prev_start = content.rfind('\n', 0, start - 1) + 1
+            if any(comment in content[prev_start:start] for comment in LEADING_COMMENTS):
+                to_remove[line_number - 1] = (prev_start, start)
+
+    # Create new content without duplicates, in file order
+    for line_number, (start, end) in sorted(to_remove.items()):
+        print(f"Removing line {line_number+1}: {content[start:end].strip()}")
+    new_content = drop_spans(content, sorted(to_remove.values()))
+
+    print(f"\n✅ Duplicates removed! Original: {count_lines(content)} lines, New: {count_lines(new_content)} lines")
+    return new_content
+
+
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='remove_all_tour_duplicates') is None:
+        print(f"✅ {TARGET} already up to date")
@@ -1,21 +1,23 @@
 #!/usr/bin/env python3
 import re
 
-with open('src/components/DaycareDataView.js', 'r') as f:
-    content = f.read()
+from patch_utils import apply_fix, buffer_output
 
-# Only remove standalone console.log lines (full lines only)
-lines = content.split('\n')
-cleaned_lines = []
+TARGET = 'src/components/DaycareDataView.js'
 
-for line in lines:
-    stripped = line.strip()
-    # Only remove if it's a complete console.log statement on its own line
-    if stripped.startswith('console.log(') and stripped.endswith(');'):
-        continue  # Skip this line
-    cleaned_lines.append(line)
+# A whole line that is nothing but a console.log(...); statement, newline included
+LOG_RE = re.compile(rb'^[ \t\r\f\v]*console\.log\([^\n]*\);[ \t\r\f\v]*(?:\n|\Z)', re.MULTILINE)
 
-with open('src/components/DaycareDataView.js', 'w') as f:
-    f.write('\n'.join(cleaned_lines))
 
-print("✅ Safely removed console logs")
+def transform(content):
+    # Only remove standalone console.log lines (full lines only)
+    return LOG_RE.sub(b'', content)
+
+
+if __name__ == '__main__':
+    buffer_output()
+    # The pattern is ASCII, so the file is cleaned as raw bytes in one C-level pass
+    if apply_fix(TARGET, transform, cache_key='safe_remove_logs', binary=True) is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("✅ Safely removed console logs")
@@ -0,0 +1,37 @@
+import os
+import shutil
+import subprocess
+import sys
+
+from patch_utils import bracket_balance, read_source
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+TARGET = os.path.join('src', 'pages', 'OptimizedMySqlHome.js')
+
+
+def run_driver(tmp_path, script):
+    """Run a driver over a copy of the component in tmp_path; return the result and original."""
+    os.makedirs(tmp_path / 'src' / 'pages')
+    shutil.copy(os.path.join(HERE, TARGET), tmp_path / TARGET)
+    result = subprocess.run(
+        [sys.executable, os.path.join(HERE, script)],
+        cwd=tmp_path, capture_output=True, text=True,
+    )
+    return result, read_source(os.path.join(HERE, TARGET))
+
+
+def test_tour_fixes_pipeline_runs_end_to_end(tmp_path):
+    result, original = run_driver(tmp_path, 'apply_all_tour_fixes.py')
+
+    assert result.returncode == 0, result.stdout
+    assert 'Applied' in result.stdout
+    assert bracket_balance(read_source(tmp_path / TARGET)) == bracket_balance(original)
+
+
+def test_tour_mode_pipeline_keeps_data_view_props(tmp_path):
+    result, _ = run_driver(tmp_path, 'apply_all_tour_mode_fixes.py')
+
+    assert result.returncode == 0, result.stdout
+    content = read_source(tmp_path / TARGET)
+    for prop in ('titleComponent', 'subtitle', 'onSearch', 'onFilter', 'onSort'):
+        assert f'{prop}=' in content
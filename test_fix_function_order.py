@@ -0,0 +1,33 @@
+from fix_function_order import transform
+
+TOUR_FUNCTIONS = (
+    "  // Toggle tour mode\n"
+    "  const toggleTourMode = useCallback(() => {\n"
+    "    setTourMode(prev => !prev);\n"
+    "  }, []);\n"
+    "\n"
+    "  const closeTourModal = useCallback(() => {\n"
+    "    setShowTourModal(false);\n"
+    "  }, []);"
+)
+
+REMOVE_FROM_COMPARISON = (
+    "  const removeFromComparison = useCallback((id) => {\n"
+    "    setDaycareComparison(prev => prev.filter(d => d.id !== id));\n"
+    "  }, [daycareComparison]);"
+)
+
+
+def test_every_copy_of_the_block_is_moved_once():
+    content = (
+        REMOVE_FROM_COMPARISON + "\n\n"
+        "  useEffect(() => {\n    toggleTourMode();\n  }, []);\n\n"
+        + TOUR_FUNCTIONS + "\n\n"
+        + TOUR_FUNCTIONS + "\n"
+    )
+
+    result = transform(content)
+
+    assert result.count("const toggleTourMode") == 1
+    assert result.count("const closeTourModal") == 1
+    assert result.index("const closeTourModal") < result.index("useEffect")
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
+from patch_utils import apply_fix, buffer_output
 
-with open('public/index.html', 'r') as f:
-    content = f.read()
+TARGET = 'public/index.html'
 
 # Find the body closing section and add scripts
 old_body_end = '''    <!-- Fix for cost estimator (priority loading) -->
@@ -26,9 +26,14 @@ new_body_end = '''    <!-- Fix for favorite notifications -->
     <script src="%PUBLIC_URL%/js/buy-me-coffee.js" defer></script>
   </body>'''
 
-content = content.replace(old_body_end, new_body_end)
 
-with open('public/index.html', 'w') as f:
-    f.write(content)
+def transform(content):
+    return content.replace(old_body_end, new_body_end)
 
-print("✅ Updated index.html with scripts")
+
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='update_index_scripts') is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("✅ Updated index.html with scripts")
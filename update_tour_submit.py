@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
+from patch_utils import apply_fix, buffer_output, load_template
 
-with open('src/pages/OptimizedMySqlHome.js', 'r') as f:
-    content = f.read()
+TARGET = 'src/pages/OptimizedMySqlHome.js'
 
 # Find and replace the onSubmit handler
 old_submit = '''        onSubmit={(formData) => {
@@ -10,63 +10,16 @@ old_submit = '''        onSubmit={(formData) => {
           // Here you could add API call to submit tour request
         }}'''
 
-new_submit = '''        onSubmit={async (formData) => {
-          try {
-            // Prepare the request payload
-            const payload = {
-              parent_name: formData.parentName,
-              parent_email: formData.parentEmail,
-              parent_phone: formData.parentPhone,
-              parent_address: formData.parentAddress || '',
-              number_of_children: formData.numberOfChildren,
-              children_ages: formData.childrenAges,
-              preferred_start_date: formData.preferredStartDate,
-              available_days: formData.availableDays,
-              preferred_time_slots: formData.preferredTimeSlots.join(', '),
-              additional_notes: formData.additionalNotes || '',
-              daycares: tourSelection.map(d => ({
-                operation_id: d.operation_id,
-                operation_name: d.operation_name,
-                location_address: d.location_address,
-                location_city: d.location_city,
-                location_state: d.location_state,
-                location_zip: d.location_zip
-              }))
-            };
+new_submit = load_template('tour_submit_handler_flat.jsx.tmpl')
 
-            console.log('Submitting tour request:', payload);
 
-            // Call the API
-            const response = await fetch('/api/tour-requests', {
-              method: 'POST',
-              headers: {
-                'Content-Type': 'application/json',
-              },
-              body: JSON.stringify(payload)
-            });
+def transform(content):
+    return content.replace(old_submit, new_submit)
 
-            const data = await response.json();
 
-            if (response.ok && data.success) {
-              console.log('Tour request successful:', data);
-              alert(`Success! Tour request #${data.tourRequestId} has been submitted. You will receive confirmation emails shortly.`);
-              
-              // Clear the selection and close modal
-              setTourSelection([]);
-              setTourMode(false);
-              closeTourModal();
-            } else {
-              throw new Error(data.message || 'Failed to submit tour request');
-            }
-          } catch (error) {
-            console.error('Error submitting tour request:', error);
-            alert('Failed to submit tour request. Please try again or contact support.');
-          }
-        }}'''
-
-content = content.replace(old_submit, new_submit)
-
-with open('src/pages/OptimizedMySqlHome.js', 'w') as f:
-    f.write(content)
-
-print("✅ API submission handler added!")
+if __name__ == '__main__':
+    buffer_output()
+    if apply_fix(TARGET, transform, cache_key='update_tour_submit') is None:
+        print(f"✅ {TARGET} already up to date")
+    else:
+        print("✅ API submission handler added!")